@@ -3,11 +3,9 @@ Aristoxenus is a back-end for simple music programs. It generates musical
 data of various kinds, which can then be used in your front-end application.
 """
 
-from aristoxenus import api
-from aristoxenus.api import (
-    endpoints,
-    classes
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from aristoxenus.core import constants
 from aristoxenus.core.constants import (
     CLOSE,
@@ -50,16 +48,60 @@ from aristoxenus.core.constants import (
     AEOLIAN,
     LOCRIAN,
 )
-from aristoxenus.api.endpoints import (
-    get_chord_from_symbol, 
-    get_chord_symbol, 
-    get_heptatonic_scale, 
-    get_heptatonic_chord
-)
-from aristoxenus.api.classes import (
-    Chord, 
-    HeptatonicScale
-)
+
+if TYPE_CHECKING:
+    # The API is loaded lazily by __getattr__ below; these imports only let
+    # type checkers see the names at the package root.
+    from aristoxenus import api
+    from aristoxenus.api import (
+        classes,
+        endpoints
+    )
+    from aristoxenus.api.classes import (
+        Chord,
+        HeptatonicScale
+    )
+    from aristoxenus.api.endpoints import (
+        get_chord_from_symbol,
+        get_chord_symbol,
+        get_heptatonic_chord,
+        get_heptatonic_chords,
+        get_heptatonic_scale
+    )
+
+# The API modules are only imported when one of their names is first used,
+# so that importing the package (e.g. for the constants) stays cheap.
+_LAZY_MODULES = {
+    'api': 'aristoxenus.api',
+    'classes': 'aristoxenus.api.classes',
+    'endpoints': 'aristoxenus.api.endpoints',
+}
+_LAZY_ATTRIBUTES = {
+    'Chord': 'aristoxenus.api.classes',
+    'HeptatonicScale': 'aristoxenus.api.classes',
+    'get_chord_from_symbol': 'aristoxenus.api.endpoints',
+    'get_chord_symbol': 'aristoxenus.api.endpoints',
+    'get_heptatonic_scale': 'aristoxenus.api.endpoints',
+    'get_heptatonic_chord': 'aristoxenus.api.endpoints',
+    'get_heptatonic_chords': 'aristoxenus.api.endpoints',
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_MODULES:
+        value = import_module(_LAZY_MODULES[name])
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     "api",
     "classes",
@@ -73,6 +115,7 @@ __all__ = [
     'get_chord_symbol',
     'get_heptatonic_scale',
     'get_heptatonic_chord',
+    'get_heptatonic_chords',
 
     "CLOSE",
     "OPEN",
@@ -5,6 +5,7 @@ from aristoxenus.api.endpoints import (
     get_chord_from_symbol,
     get_chord_symbol,
     get_heptatonic_chord,
+    get_heptatonic_chords,
     get_heptatonic_scale,
 )
 from aristoxenus.api.classes import (
@@ -20,6 +21,7 @@ __all__ = [
     'get_chord_symbol',
     'get_heptatonic_scale',
     'get_heptatonic_chord',
+    'get_heptatonic_chords',
 
     'Chord',
     'HeptatonicScale'
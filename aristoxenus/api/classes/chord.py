@@ -1,4 +1,5 @@
 
+from copy import copy
 from typing import Optional, Sequence
 
 from aristoxenus.core.annotations import (
@@ -14,24 +15,16 @@ from aristoxenus.core.constants import (
     CHORD_MAJ,
     CHORD_MIN,
     CLOSE,
-    D2,
-    D23,
-    D24,
-    D3,
     DIM_SYMBOL,
-    DROP_2_AND_3_VOICING,
-    DROP_2_AND_4_VOICING,
-    DROP_2_VOICING,
-    DROP_3_VOICING,
     INTERVAL_NAMES,
     INTERVAL_STRUCTURE,
     MAJ_SYMBOL,
     MIN_SYMBOL,
     NOTE_NAMES,
-    OPEN,
     SLASH,
     SLASH_SYMBOL,
-    TONES
+    TONES,
+    VOICINGS
 )
 from aristoxenus.core.interval import sort_interval_names
 from aristoxenus.core.resolve import resolve_chord_symbol
@@ -42,11 +35,27 @@ __all__ = [
     'Chord'
 ]
 
+_ROOT = '1'
+
 class Chord:
     '''
     The Chord class provides a simple interface for manipulating chord
     structures.
     '''
+    __slots__ = (
+        'note_names',
+        'interval_names',
+        'interval_structure',
+        '__root_index',
+        '__sorted_interval_names',
+        '__is_close',
+        '__slash',
+        '__maj_symbol',
+        '__min_symbol',
+        '__dim_symbol',
+        '__symbol',
+        '__style'
+    )
 
     def __init__(
         self,
@@ -57,28 +66,55 @@ class Chord:
         note_names = note_names or ('C', 'E', 'G', 'B')
         interval_names = interval_names or ('1', '3', '5', '7')
         interval_structure = interval_structure or (0, 4, 7, 11)
-        self.note_names = tuple(note_names)
-        self.interval_names = tuple(interval_names)
-        self.interval_structure = tuple(interval_structure)
+        # The core functions already return tuples, which can be kept as is.
+        self.note_names = (note_names if isinstance(note_names, tuple)
+                           else tuple(note_names))
+        self.interval_names = (interval_names if isinstance(interval_names, tuple)
+                               else tuple(interval_names))
+        self.interval_structure = (interval_structure
+                                   if isinstance(interval_structure, tuple)
+                                   else tuple(interval_structure))
+        self.__root_index = (self.interval_names.index(_ROOT)
+                             if _ROOT in self.interval_names else 0)
+        self.__sorted_interval_names = sort_interval_names(self.interval_names)
+        self.__is_close = self.__sorted_interval_names == self.interval_names
         self.__slash = True
         self.__maj_symbol = CHORD_MAJ
         self.__min_symbol = CHORD_MIN
         self.__dim_symbol = CHORD_DIM
+        self.__restyle()
+
+    def __restyle(self) -> None:
+        '''
+        Rebuild the style configuration after any of its options changes,
+        and discard the symbol that was rendered with the old options.
+        '''
+        self.__symbol: Optional[str] = None
+        self.__style: ChordStyle = {
+            SLASH: self.__slash,
+            MAJ_SYMBOL: self.__maj_symbol,
+            MIN_SYMBOL: self.__min_symbol,
+            DIM_SYMBOL: self.__dim_symbol
+        }
 
     @property
     def root(self) -> str:
         '''
         The note name that serves as the root of the chord's structure.
         '''
-        i = self.interval_names.index(str(1))
-        return self.note_names[i]
+        return self.note_names[self.__root_index]
 
     @property
     def symbol(self) -> str:
         '''
         The basic symbol by which the chord can be identified.
         '''
-        intervals = sort_interval_names(self.interval_names)
+        if self.__symbol is None:
+            self.__symbol = self.__encode_symbol()
+        return self.__symbol
+
+    def __encode_symbol(self) -> str:
+        intervals = self.__sorted_interval_names
         if self.note_names[0] != self.root and self.__slash:
             symb = encode_chord_symbol(
                 interval_names=intervals,
@@ -94,34 +130,34 @@ class Chord:
         return self.root + encode_chord_symbol(intervals)
 
     def __repr__(self) -> str:
+        return self.__class__.__name__ + f"(chord_symbol={self.symbol!r})"
+
+    def __str__(self) -> str:
+        return self.symbol
+
+    def verbose_repr(self) -> str:
+        '''
+        Return a representation of the chord that includes all of its
+        structural data.
+        '''
         note_names = self.note_names
         interval_symbols = self.interval_names
         interval_structure = self.interval_structure
         chord_symbol = self.symbol
         return self.__class__.__name__ + f"({chord_symbol=}, {note_names=}, {interval_symbols=}, {interval_structure=})"
 
-    @property
-    def __is_close(self) -> bool:
-        ordered = sort_interval_names(self.interval_names)
-        return ordered == tuple(x for x in self.interval_names)
-
     def reset(self) -> 'Chord':
         '''
         Return the close-voiced root position form of this chord.
         '''
-        order = sort_interval_names(self.interval_names)
-        names: list[str] = []
-        symbols: list[str] = []
-        intervals: list[int] = []
-        for x in order:
-            i = self.interval_names.index(x)
-            names.append(self.note_names[i])
-            symbols.append(self.interval_names[i])
-            intervals.append(self.interval_structure[i])
-        for i, interval in enumerate(intervals):
-            if interval > 11:
-                intervals[i] = interval % TONES
-        return self.__class__(tuple(names), tuple(symbols), tuple(intervals))
+        # Map each interval name to its first position in this voicing.
+        position = {name: i for i, name in reversed(
+            tuple(enumerate(self.interval_names)))}
+        indices = [position[x] for x in self.__sorted_interval_names]
+        return self.__class__(
+            tuple(self.note_names[i] for i in indices),
+            tuple(self.interval_names[i] for i in indices),
+            tuple(self.interval_structure[i] % TONES for i in indices))
 
     @classmethod
     def from_symbol(cls, symbol: str) -> 'Chord':
@@ -149,9 +185,9 @@ class Chord:
         ChordData dictionary.
         '''
         chord = cls(
-            note_names=tuple(data[NOTE_NAMES]),
-            interval_names=tuple(data[INTERVAL_NAMES]),
-            interval_structure=tuple(data[INTERVAL_STRUCTURE])
+            note_names=data[NOTE_NAMES],
+            interval_names=data[INTERVAL_NAMES],
+            interval_structure=data[INTERVAL_STRUCTURE]
         )
         if style:
             return chord.set_style(style)
@@ -159,20 +195,20 @@ class Chord:
 
     def get_style(self) -> ChordStyle:
         '''Return a dictionary of the chord's style configuration.'''
-        return {
-            SLASH: self.__slash,
-            MAJ_SYMBOL: self.__maj_symbol,
-            MIN_SYMBOL: self.__min_symbol,
-            DIM_SYMBOL: self.__dim_symbol
-        }
+        return self.__style.copy()
 
     def set_style(self, style:  ChordStyle) -> 'Chord':
-        '''Configure the chord's style with a dictionary of options.'''
-        self.__slash = style.get(SLASH, True)
-        self.__maj_symbol = style.get(MAJ_SYMBOL, CHORD_MAJ)
-        self.__min_symbol = style.get(MIN_SYMBOL, CHORD_MIN)
-        self.__dim_symbol = style.get(DIM_SYMBOL, CHORD_DIM)
-        return self
+        '''
+        Return a copy of the chord configured with a dictionary of style
+        options. Options missing from the dictionary take their defaults.
+        '''
+        chord = copy(self)
+        chord.__slash = style.get(SLASH, True)
+        chord.__maj_symbol = style.get(MAJ_SYMBOL, CHORD_MAJ)
+        chord.__min_symbol = style.get(MIN_SYMBOL, CHORD_MIN)
+        chord.__dim_symbol = style.get(DIM_SYMBOL, CHORD_DIM)
+        chord.__restyle()
+        return chord
 
     def to_ChordData(self) -> ChordData:
         ''' 
@@ -184,6 +220,35 @@ class Chord:
             interval_names=self.interval_names,
             interval_structure=self.interval_structure)
 
+    def __to_unnamed_ChordData(self) -> ChordData:
+        '''
+        Return the chord's data for the core functions, without rendering a
+        symbol that would only be discarded along with the intermediate data.
+        '''
+        return ChordData(
+            chord_symbol='',
+            note_names=self.note_names,
+            interval_names=self.interval_names,
+            interval_structure=self.interval_structure)
+
+    def __derive(self, data: ChordData) -> 'Chord':
+        '''
+        Return a chord built from the given data, with this chord's style.
+        '''
+        chord = self.__class__(
+            note_names=data[NOTE_NAMES],
+            interval_names=data[INTERVAL_NAMES],
+            interval_structure=data[INTERVAL_STRUCTURE]
+        )
+        chord.__slash = self.__slash
+        chord.__maj_symbol = self.__maj_symbol
+        chord.__min_symbol = self.__min_symbol
+        chord.__dim_symbol = self.__dim_symbol
+        # The style dictionary is rebuilt rather than mutated whenever an
+        # option changes, so the two chords can safely share it.
+        chord.__style = self.__style
+        return chord
+
     def invert(self, degree: int) -> 'Chord':
         '''
         Return an inversion of this chord, rotated to the given degree.
@@ -199,8 +264,8 @@ class Chord:
             chord = self
         else:
             chord = self.reset()
-        result = rotate_chord(chord.to_ChordData(), degree)
-        return self.from_ChordData(result, style=self.get_style())
+        result = rotate_chord(chord.__to_unnamed_ChordData(), degree)
+        return self.__derive(result)
 
     def apply_voicing(self, voicing: Sequence[int] | str) -> 'Chord':
         '''
@@ -214,43 +279,32 @@ class Chord:
 
         '''
         if isinstance(voicing, str):
-            if voicing in [D2, OPEN]:
-                voicing = DROP_2_VOICING
-            elif voicing == D3:
-                voicing = DROP_3_VOICING
-            elif voicing == D23:
-                voicing = DROP_2_AND_3_VOICING
-            elif voicing == D24:
-                voicing = DROP_2_AND_4_VOICING
-            elif voicing == CLOSE:
-                inversion = sort_interval_names(
-                    self.interval_names).index(self.interval_names[0])
+            if voicing == CLOSE:
+                inversion = self.__sorted_interval_names.index(
+                    self.interval_names[0])
                 return self.reset().invert(inversion)
-            else:
+            if voicing not in VOICINGS:
                 return self
+            voicing = VOICINGS[voicing]
 
-        result = apply_drop_voicing(self.to_ChordData(), voicing)
-        return self.from_ChordData(result, style=self.get_style())
+        result = apply_drop_voicing(self.__to_unnamed_ChordData(), voicing)
+        return self.__derive(result)
 
     def use_slash(self, slash: bool) -> 'Chord':
-        '''Configure the slash notation in the chord symbol.'''
-        self.__slash = slash
-        return self
+        '''Return a copy of the chord with the given slash notation setting.'''
+        return self.set_style(self.__style | ChordStyle(slash=slash))
 
     def set_maj_symbol(self, maj_symbol: str) -> 'Chord':
-        '''Configure the 'major' symbol in the chord symbol.'''
-        self.__maj_symbol = maj_symbol
-        return self
+        '''Return a copy of the chord with the given 'major' symbol.'''
+        return self.set_style(self.__style | ChordStyle(maj_symbol=maj_symbol))
 
     def set_min_symbol(self, min_symbol: str) -> 'Chord':
-        '''Configure the 'minor' symbol in the chord symbol.'''
-        self.__min_symbol = min_symbol
-        return self
+        '''Return a copy of the chord with the given 'minor' symbol.'''
+        return self.set_style(self.__style | ChordStyle(min_symbol=min_symbol))
 
     def set_dim_symbol(self, dim_symbol: str) -> 'Chord':
-        '''Configure the 'diminished' symbol in the chord symbol.'''
-        self.__dim_symbol = dim_symbol
-        return self
+        '''Return a copy of the chord with the given 'diminished' symbol.'''
+        return self.set_style(self.__style | ChordStyle(dim_symbol=dim_symbol))
 
     def __len__(self) -> int:
         return len(self.note_names)
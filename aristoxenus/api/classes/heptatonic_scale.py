@@ -1,10 +1,10 @@
-import re
-from typing import Sequence
+from typing import Optional, Sequence
 
 from aristoxenus.api.classes.chord import Chord
 from aristoxenus.api.classes.note import Note
 from aristoxenus.api.classes.scale import Scale
 from aristoxenus.core.annotations import (
+    ChordData,
     NoteNameData
 )
 from aristoxenus.core.chordify import (
@@ -13,8 +13,7 @@ from aristoxenus.core.chordify import (
 )
 from aristoxenus.core.constants import (
     HEPTATONIC_SCALES,
-    NOTES,
-    RE_PARSE_NOTE_NAME
+    NOTES
 )
 from aristoxenus.core.heptatonic_spelling import (
     get_heptatonic_interval_names, 
@@ -26,7 +25,10 @@ from aristoxenus.core.resolve import (
     resolve_scale_alias, 
     resolve_heptatonic_scale
 )
-from aristoxenus.core.validation import validate_heptatonic_structure
+from aristoxenus.core.validation import (
+    validate_alphabetic_name,
+    validate_heptatonic_structure
+)
 
 __all__ = [
     'HeptatonicScale'
@@ -39,6 +41,17 @@ class HeptatonicScale(Scale):
     This class provides a simple interface for manipulating scale forms and
     the chords derived from them.
     '''
+    __slots__ = (
+        '__keynote',
+        '__scale_name',
+        '__mode_name',
+        '__keynote_data',
+        '__interval_structure',
+        '__note_names',
+        '__interval_names',
+        '__chord_tables'
+    )
+
     def __init__(
         self,
         keynote: str = 'C',
@@ -51,50 +64,129 @@ class HeptatonicScale(Scale):
                 raise ArgumentError("This class can only be initialized with a heptatonic scale.")
             scale_name = config[0]
             mode_name = config[1]
-            
-        self.keynote = keynote
-        self.scale_name = scale_name
-        self.mode_name = mode_name
 
+        self.__keynote = keynote
+        self.__scale_name = scale_name
+        self.__mode_name = mode_name
+        self.__clear_cache()
+
+    def __clear_cache(self) -> None:
+        '''
+        Discard the derived data, so that it will be recalculated from the
+        current configuration on next access.
+        '''
+        self.__keynote_data: Optional[NoteNameData] = None
+        self.__interval_structure: Optional[tuple[int, ...]] = None
+        self.__note_names: Optional[tuple[str, ...]] = None
+        self.__interval_names: Optional[tuple[str, ...]] = None
+        # Chordified scales, keyed by (size, sus), where a sus of 0 stands
+        # for the tertial chords.
+        self.__chord_tables: dict[tuple[int, int], tuple[ChordData, ...]] = {}
+
+    @property
+    def keynote(self) -> str:
+        '''The note name of the scale's tonic.'''
+        return self.__keynote
+
+    @keynote.setter
+    def keynote(self, keynote: str) -> None:
+        self.__keynote = keynote
+        self.__clear_cache()
+
+    @property
+    def scale_name(self) -> str:
+        '''The name of the parent scale.'''
+        return self.__scale_name
+
+    @scale_name.setter
+    def scale_name(self, scale_name: str) -> None:
+        self.__scale_name = scale_name
+        self.__clear_cache()
+
+    @property
+    def mode_name(self) -> str:
+        '''The name of the mode to which the parent scale is rotated.'''
+        return self.__mode_name
+
+    @mode_name.setter
+    def mode_name(self, mode_name: str) -> None:
+        self.__mode_name = mode_name
+        self.__clear_cache()
 
     @property
     def __kn(self) -> NoteNameData:
         '''The deciphered keynote.'''
-        if not re.search(RE_PARSE_NOTE_NAME, self.keynote):
-            raise ArgumentError('Unable to parse note name.')
-        return decode_note_name(self.keynote)
+        if self.__keynote_data is None:
+            if not validate_alphabetic_name(self.keynote):
+                raise ArgumentError('Unable to parse note name.')
+            self.__keynote_data = decode_note_name(self.keynote)
+        return self.__keynote_data
     
     def get_degree(self, degree: int) -> Note:
-        octave = 1
-        if degree > NOTES:
-            octave = int(degree / NOTES) + 1
-            degree %= NOTES
-        degree -= 1
+        '''
+        Get the note at the given scale degree, where 1-7 are in the first
+        octave, 8-14 in the second, and so on.
+        '''
+        octave, i = divmod(degree - 1, NOTES)
         return Note(
-            note_name=self.note_names[degree], 
-            interval_name=self.interval_names[degree], 
-            octave=octave
+            note_name=self.note_names[i], 
+            interval_name=self.interval_names[i], 
+            octave=octave + 1
         )
     
     def get_native_pattern(self, pattern: Sequence[int]) -> tuple[Note, ...]:
-        notes: list[Note] = []
-        for i in pattern:
-            notes.append(self.get_degree(i))
-        return tuple(notes)
+        '''Get the notes at each of the given scale degrees.'''
+        note_names = self.note_names
+        interval_names = self.interval_names
+        return tuple(
+            Note(
+                note_name=note_names[(i - 1) % NOTES],
+                interval_name=interval_names[(i - 1) % NOTES],
+                octave=(i - 1) // NOTES + 1
+            )
+            for i in pattern
+        )
 
     @property
     def interval_structure(self) -> tuple[int, ...]:
         '''The interval structure of this scaleform.'''
-        return resolve_heptatonic_scale(self.scale_name, self.mode_name)
+        if self.__interval_structure is None:
+            self.__interval_structure = resolve_heptatonic_scale(
+                self.scale_name, self.mode_name)
+        return self.__interval_structure
 
     @property
     def note_names(self) -> tuple[str, ...]:
         '''The note names for this scaleform and keynote.'''
-        return get_heptatonic_note_names(self.__kn, self.interval_structure)
+        if self.__note_names is None:
+            self.__note_names = get_heptatonic_note_names(
+                self.__kn, self.interval_structure)
+        return self.__note_names
     
     @property
     def interval_names(self) -> tuple[str, ...]:
-        return get_heptatonic_interval_names(self.interval_structure)
+        '''The interval names for this scaleform.'''
+        if self.__interval_names is None:
+            self.__interval_names = get_heptatonic_interval_names(
+                self.interval_structure)
+        return self.__interval_names
+
+    def __chord_table(self, size: int, sus: int = 0) -> tuple[ChordData, ...]:
+        '''
+        Get the chords of the given size built on every degree of the scale,
+        chordifying the scale only on the first request.
+        '''
+        key = (size, sus)
+        table = self.__chord_tables.get(key)
+        if table is None:
+            if sus:
+                table = chordify_heptatonic_sus(
+                    self.__kn, self.interval_structure, size, sus)
+            else:
+                table = chordify_heptatonic_tertial(
+                    self.__kn, self.interval_structure, size)
+            self.__chord_tables[key] = table
+        return table
 
     def get_tertial_chord(self, degree: int = 1, size: int = 3) -> Chord:
         '''
@@ -117,17 +209,15 @@ class HeptatonicScale(Scale):
         ArgumentError
             If any of the parameters does not adhere to the limits above.
         '''
-        if degree not in range(1, 8): 
+        if not 1 <= degree <= 7:
             raise ArgumentError(f"Scale degree must be between 1 and 7 ({degree=})")
-        if size not in range(3, 8):
+        if not 3 <= size <= 7:
             raise ArgumentError(f"Chord size must be between 3 and 7 ({size=})")
 
         degree -= 1
         if degree > len(self.note_names):
             degree %= len(self.note_names)
-        ch_scale = chordify_heptatonic_tertial(self.__kn,
-                                               self.interval_structure,  size)
-        chord = ch_scale[degree]
+        chord = self.__chord_table(size)[degree]
         return Chord.from_ChordData(chord)
 
     def get_sus_chord(self, degree: int = 1, size: int = 3, sus: int = 2) -> Chord:
@@ -153,18 +243,16 @@ class HeptatonicScale(Scale):
         ArgumentError
             If any of the parameters does not adhere to the limits above.
         '''
-        if degree not in range(1, 8): 
+        if not 1 <= degree <= 7:
             raise ArgumentError(f"Scale degree must be between 1 and 7 ({degree=})")
-        if size not in range(3, 8):
+        if not 3 <= size <= 7:
             raise ArgumentError(f"Chord size must be between 3 and 7 ({size=})")
-        if sus not in [2, 4]:
+        if sus != 2 and sus != 4:
             raise ArgumentError(f"Can only suspend 2 or 4 ({sus=})")
         degree -= 1
         if degree > len(self.note_names):
             degree %= len(self.note_names)
-        ch_scale = chordify_heptatonic_sus(
-            self.__kn, self.interval_structure,  size, sus)
-        chord = ch_scale[degree]
+        chord = self.__chord_table(size, sus)[degree]
         return Chord.from_ChordData(chord)
 
     def get_tertial_triad(self, degree: int) -> Chord:
@@ -1,10 +1,8 @@
-
-
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Iterable, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Note:
     note_name: Optional[str] = None
     interval_name: Optional[str] = None
@@ -14,6 +12,7 @@ class Note:
     annotation: Optional[str] = None
 
     def __repr__(self):
-        field_values = {k: v for k, v in self.__dict__.items() if v is not None}
+        field_values = {f.name: v for f in fields(self)
+                        if (v := getattr(self, f.name)) is not None}
         field_str = ', '.join(f'{k}={repr(v)}' for k, v in field_values.items())
-        return f'{self.__class__.__name__}({field_str})'
\ No newline at end of file
+        return f'{self.__class__.__name__}({field_str})'
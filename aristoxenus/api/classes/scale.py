@@ -3,6 +3,7 @@ from aristoxenus.core.constants import WHITESPACE
 
 class Scale:
     '''Middleman placeholder for now.'''
+    __slots__ = ()
 
     def __init__(self):
         ...
@@ -14,8 +14,12 @@ functions, see the objects available in the ``classes`` module.
 # for the benefit of the user. In this case, it's better to be a bit more
 # explicit so we really make our point clearly.
 
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
 from typing import (
     Iterable,
+    NamedTuple,
     Optional
 )
 from aristoxenus.core.annotations import (
@@ -35,7 +39,6 @@ from aristoxenus.core.constants import (
     CHORD_MIN,
     CHORD_SYMBOL,
     CLOSE,
-    D2,
     D23,
     D24,
     D3,
@@ -46,6 +49,7 @@ from aristoxenus.core.constants import (
     DROP_2_VOICING,
     DROP_3_VOICING,
     INTERVAL_NAMES,
+    INTERVAL_STRUCTURE,
     IONIAN,
     MAJ_SYMBOL,
     MIN_SYMBOL,
@@ -89,14 +93,72 @@ __all__ = [
     'get_chord_from_symbol',
     'get_chord_symbol',
     'get_heptatonic_chord',
+    'get_heptatonic_chords',
     'get_heptatonic_scale'
 ]
 
+_CHORD_SIZES = frozenset(range(3, 8))
+_CHORD_DEGREES = frozenset(range(1, 8))
+_CHORD_INVERSIONS = {size: frozenset(range(size)) for size in _CHORD_SIZES}
+# Voicings that need more than three notes, and fall back to drop 2.
+_TETRAD_VOICINGS = frozenset((D3, D24, D23))
 
 
+@dataclass(frozen=True, slots=True)
+class _FrozenChord:
+    '''
+    An immutable record of a chord's data, which can be shared by cached
+    results and converted to a ChordData dictionary for a response.
+    '''
+    chord_symbol: str
+    note_names: tuple[str, ...]
+    interval_names: tuple[str, ...]
+    interval_structure: tuple[int, ...]
+
+    @classmethod
+    def from_ChordData(cls, data: ChordData) -> '_FrozenChord':
+        '''Return a record with the same data as the given dictionary.'''
+        return cls(
+            chord_symbol=data[CHORD_SYMBOL],
+            note_names=data[NOTE_NAMES],
+            interval_names=data[INTERVAL_NAMES],
+            interval_structure=data[INTERVAL_STRUCTURE]
+        )
+
+    def to_ChordData(self) -> ChordData:
+        '''Return a new dictionary with the chord's data.'''
+        return ChordData(
+            chord_symbol=self.chord_symbol,
+            note_names=self.note_names,
+            interval_names=self.interval_names,
+            interval_structure=self.interval_structure
+        )
+
+
+class _SymbolStyle(NamedTuple):
+    '''
+    The symbols used by ``get_chord_symbol``, in a hashable form that can
+    serve as part of a cache key.
+    '''
+    maj_symbol: str
+    min_symbol: str
+    dim_symbol: str
+
+    def to_ChordStyle(self) -> ChordStyle:
+        '''Return a new style dictionary with the same symbols.'''
+        return ChordStyle(
+            maj_symbol=self.maj_symbol,
+            min_symbol=self.min_symbol,
+            dim_symbol=self.dim_symbol
+        )
+
 
+# The names given to intervals that are expressed as integers.
+_DUMMY_INTERVAL_NAMES = ('1', 'b2', '2', 'b3', '3', '4',
+                         'b5', '5', '#5', '6', 'b7', '7')
 
-def get_heptatonic_scale(keynote: Optional[str] = None, scale_name: Optional[str] = None, mode_name: Optional[str] = None) -> HeptatonicScaleData:
+
+def get_heptatonic_scale(keynote: Optional[str] = None, scale_name: Optional[str] = None, mode_name: Optional[str] = None, *, recommend: bool = True) -> HeptatonicScaleData:
     '''
     Return a collection of note and interval names for a given scale form.
 
@@ -108,6 +170,11 @@ def get_heptatonic_scale(keynote: Optional[str] = None, scale_name: Optional[str
         _description_, by default None = 'diatonic'
     modal_name : str, optional
         _description_, by default None = 'ionian'
+    recommend : bool, optional
+        Whether to search for the best spelling of the scale, by default True.
+        Callers that already control the spelling of the keynote can pass
+        False, in which case the recommended keynote and rendering are the
+        requested ones.
 
     Returns
     -------
@@ -144,18 +211,10 @@ def get_heptatonic_scale(keynote: Optional[str] = None, scale_name: Optional[str
     TODO: Examples
     '''
     keynote = keynote or 'C'
-    if (n := decode_note_name(keynote)):
-        tonic = n
-    else:
-        raise StringValidationError(keynote, NOTE_NAME)
     scale_name = scale_name or DIATONIC
-    interval_structure = resolve_heptatonic_scale(scale_name, mode_name)
-    interval_scale = get_heptatonic_interval_names(interval_structure)
-    roman_names = convert_interval_names_to_roman_names(interval_scale)
-    requested_rendering = get_heptatonic_note_names(tonic, interval_structure)
-    recommended_rendering = get_best_heptatonic_names(tonic, interval_structure)
-    recommended_keynote = recommended_rendering[0]
-    step_formula = calculate_formula(interval_structure)
+    (interval_structure, interval_scale, roman_names, requested_rendering,
+     recommended_keynote, recommended_rendering, step_formula
+     ) = _get_heptatonic_scale(keynote, scale_name, mode_name, recommend)
     return HeptatonicScaleData(
         keynote=keynote,
         scale_name=scale_name,
@@ -170,6 +229,36 @@ def get_heptatonic_scale(keynote: Optional[str] = None, scale_name: Optional[str
     )
 
 
+@lru_cache(maxsize=1024)
+def _get_heptatonic_scale(keynote: str, scale_name: str, mode_name: Optional[str], recommend: bool) -> tuple[
+        tuple[int, ...], tuple[str, ...], tuple[str, ...], tuple[str, ...],
+        str, tuple[str, ...], tuple[str, ...]]:
+    '''
+    Calculate the data for ``get_heptatonic_scale``.
+
+    The values are returned as a tuple, in the order of the response keys,
+    so that the cached result cannot be modified through the response.
+    '''
+    if (n := decode_note_name(keynote)):
+        tonic = n
+    else:
+        raise StringValidationError(keynote, NOTE_NAME)
+    interval_structure = resolve_heptatonic_scale(scale_name, mode_name)
+    interval_scale = get_heptatonic_interval_names(interval_structure)
+    roman_names = convert_interval_names_to_roman_names(interval_scale)
+    requested_rendering = get_heptatonic_note_names(tonic, interval_structure)
+    if recommend:
+        recommended_rendering = get_best_heptatonic_names(
+            tonic, interval_structure)
+    else:
+        recommended_rendering = requested_rendering
+    recommended_keynote = recommended_rendering[0]
+    step_formula = calculate_formula(interval_structure)
+    return (interval_structure, interval_scale, roman_names,
+            requested_rendering, recommended_keynote, recommended_rendering,
+            step_formula)
+
+
 def get_heptatonic_chord(keynote: str = 'C', scale_name: str = DIATONIC, mode_name: str = IONIAN, chord_degree: int = 1, chord_size: int = 3, chord_inversion: int = 0, chord_voicing: str = CLOSE, structure: str = TERTIAL, chord_style: Optional[ChordStyle] = None) -> ChordData:
     '''
     Create a single chord from a given parent scale's chord scale.
@@ -197,9 +286,10 @@ def get_heptatonic_chord(keynote: str = 'C', scale_name: str = DIATONIC, mode_na
     structure : str, optional
         What structural principal will be used to build the chord.
         Choices are 'tertial', 'sus2', and 'sus4'.
-    use_slash : bool, by default False
-        If True, the chord symbol will represent the inversion with slash 
-        notation.
+    chord_style : ChordStyle, optional
+        The style of the chord symbol, by default None. If its 'slash'
+        option is True, the chord symbol will represent the inversion with
+        slash notation.
 
     Returns
     -------
@@ -208,26 +298,115 @@ def get_heptatonic_chord(keynote: str = 'C', scale_name: str = DIATONIC, mode_na
 
     TODO: Examples
     '''
-    scale_root = decode_note_name(keynote)
-    interval_structure = resolve_heptatonic_scale(scale_name, mode_name)
-    chord_scale: tuple[ChordData, ...]
-    voicing: tuple[int, ...] = tuple()
-    
-    if chord_voicing not in VOICINGS:
-        chord_voicing = CLOSE
-
-    if chord_size not in range(3, 8):
+    if chord_size not in _CHORD_SIZES:
         chord_size = 3
 
-    if chord_voicing in [D3, D24, D23] and chord_size == 3:
-        chord_voicing = D2
+    chord_scale = _get_chord_scale(
+        keynote, scale_name, mode_name, chord_size, structure)
+    return _get_scale_chord(chord_scale, chord_degree, chord_size,
+                            chord_inversion, chord_voicing, chord_style)
 
-    if chord_degree not in range(1, 8):
+
+def get_heptatonic_chords(keynote: str = 'C', scale_name: str = DIATONIC, mode_name: str = IONIAN, *, degrees: Iterable[int] = range(1, 8), sizes: Iterable[int] = (3,), inversions: Iterable[int] = (0,), voicings: Iterable[str] = (CLOSE,), structure: str = TERTIAL, chord_style: Optional[ChordStyle] = None) -> tuple[ChordData, ...]:
+    '''
+    Create several chords from a given parent scale's chord scales,
+    chordifying the scale only once for each chord size.
+
+    Parameters
+    ----------
+    keynote : str, optional
+        The keynote of the parent scale, by default 'C'
+    scale_name : str, optional
+        The name of the parent scale, by default 'diatonic'
+    mode_name : str, optional
+        The name of the parent mode, by default 'ionian'
+    degrees : Iterable[int], optional
+        The degrees of the parent scale to derive chords from, by default
+        all of them (1-7).
+    sizes : Iterable[int], optional
+        The numbers of notes in the derived chords, by default (3,).
+    inversions : Iterable[int], optional
+        The inversions of the derived chords, by default (0,).
+    voicings : Iterable[str], optional
+        The voicings of the derived chords, by default ('close',).
+    structure : str, optional
+        What structural principal will be used to build the chords.
+        Choices are 'tertial', 'sus2', and 'sus4'.
+    chord_style : ChordStyle, optional
+        The style of the chord symbols, as in ``get_heptatonic_chord``.
+
+    Returns
+    -------
+    tuple[ChordResponse, ...]
+        One chord for each combination of size, degree, inversion and
+        voicing, in that order of precedence. Each chord is the same as
+        ``get_heptatonic_chord`` would return for the same arguments.
+    '''
+    degrees = tuple(degrees)
+    inversions = tuple(inversions)
+    voicings = tuple(voicings)
+    chords: list[ChordData] = []
+    for chord_size in sizes:
+        if chord_size not in _CHORD_SIZES:
+            chord_size = 3
+        chord_scale = _get_chord_scale(
+            keynote, scale_name, mode_name, chord_size, structure)
+        chords.extend(
+            _get_scale_chord(chord_scale, chord_degree, chord_size,
+                             chord_inversion, chord_voicing, chord_style)
+            for chord_degree, chord_inversion, chord_voicing
+            in product(degrees, inversions, voicings)
+        )
+    return tuple(chords)
+
+
+def _get_scale_chord(chord_scale: tuple[_FrozenChord, ...], chord_degree: int, chord_size: int, chord_inversion: int, chord_voicing: str, chord_style: Optional[ChordStyle]) -> ChordData:
+    '''
+    Derive one chord from a chordified scale, as described by the arguments
+    of ``get_heptatonic_chord``.
+    '''
+    use_slash = bool(chord_style and chord_style.get(SLASH))
+    # Unknown voicings leave the chord in close voicing.
+    voicing = VOICINGS.get(chord_voicing)
+
+    if chord_voicing in _TETRAD_VOICINGS and chord_size == 3:
+        voicing = DROP_2_VOICING
+
+    if chord_degree not in _CHORD_DEGREES:
         chord_degree = 1
 
-    if chord_inversion not in range(chord_size):
+    if chord_inversion not in _CHORD_INVERSIONS[chord_size]:
         chord_inversion = 0
 
+    chord = chord_scale[chord_degree - 1].to_ChordData()
+    root = chord[NOTE_NAMES][0]
+    chord = rotate_chord(chord, chord_inversion)
+
+    # If the user wants slash notation, we regenerate the symbol to reflect
+    # the inverted bass note.
+    if use_slash:
+        bass = chord[NOTE_NAMES][0]
+        symbol = encode_chord_symbol(chord[INTERVAL_NAMES], chord_style)
+        chord[CHORD_SYMBOL] = f"{root}{symbol}{SLASH_SYMBOL}{bass}"
+
+    if voicing is None:
+        return chord
+    return apply_drop_voicing(chord, voicing)
+
+
+@lru_cache(maxsize=1024)
+def _get_chord_scale(keynote: str, scale_name: str, mode_name: str, chord_size: int, structure: str) -> tuple[_FrozenChord, ...]:
+    '''
+    Chordify the given scale for ``get_heptatonic_chord``, which only needs
+    one chord of the scale, but will often be called for the others too.
+
+    The chords are frozen, so that the cached scale cannot be modified
+    through a response.
+    '''
+    scale_root = decode_note_name(keynote)
+    interval_structure = resolve_heptatonic_scale(scale_name, mode_name)
+    chord_scale: tuple[ChordData, ...]
+
     if structure == TERTIAL:
         chord_scale = chordify_heptatonic_tertial(
             interval_structure=interval_structure,
@@ -252,26 +431,7 @@ def get_heptatonic_chord(keynote: str = 'C', scale_name: str = DIATONIC, mode_na
     else:
         raise ArgumentError(f'Unknown structural modifier {structure=}')
 
-    chord = chord_scale[chord_degree - 1]
-    root = chord[NOTE_NAMES][0]
-    chord = rotate_chord(chord, chord_inversion)
-
-    # If the user wants slash notation, we regenerate the symbol to reflect
-    # the inverted bass note.
-    if chord_style and SLASH in chord_style:
-        bass = chord[NOTE_NAMES][0]
-        chord[CHORD_SYMBOL] = (
-            root
-            + encode_chord_symbol(chord[INTERVAL_NAMES], chord_style)
-            + SLASH_SYMBOL
-            + bass
-        )
-
-    if chord_voicing == CLOSE:
-        return chord
-
-    voicing = VOICINGS[chord_voicing]
-    return apply_drop_voicing(chord, voicing)
+    return tuple(_FrozenChord.from_ChordData(chord) for chord in chord_scale)
 
 
 def get_chord_symbol(intervals: Iterable[int | str], config: Optional[ChordStyle] = None) -> ChordSymbolData:
@@ -300,31 +460,36 @@ def get_chord_symbol(intervals: Iterable[int | str], config: Optional[ChordStyle
 
     TODO: Examples
     '''
-    dummy_names = ('1', 'b2', '2', 'b3', '3', '4',
-                   'b5', '5', '#5', '6', 'b7', '7')
-    validated_intervals: list[str] = []
-
-    for interval in intervals:
-        if isinstance(interval, int):
-            interval %= TONES
-            validated_intervals.append(dummy_names[interval])
-        else:
-            if validate_interval_name(interval):
-                validated_intervals.append(interval)
     config = config or {}
-    validated_config: ChordStyle = {}
-    validated_config[MAJ_SYMBOL] = config.get(MAJ_SYMBOL, CHORD_MAJ)
-    validated_config[MIN_SYMBOL] = config.get(MIN_SYMBOL, CHORD_MIN)
-    validated_config[DIM_SYMBOL] = config.get(DIM_SYMBOL, CHORD_DIM)
-
-    symbol = encode_chord_symbol(validated_intervals, validated_config)
+    style = _SymbolStyle(
+        maj_symbol=config.get(MAJ_SYMBOL, CHORD_MAJ),
+        min_symbol=config.get(MIN_SYMBOL, CHORD_MIN),
+        dim_symbol=config.get(DIM_SYMBOL, CHORD_DIM)
+    )
+    validated_intervals = tuple(
+        _DUMMY_INTERVAL_NAMES[interval % TONES]
+        if isinstance(interval, int) else interval
+        for interval in intervals
+        if isinstance(interval, int) or validate_interval_name(interval)
+    )
+    interval_names, symbol = _encode_chord(validated_intervals, style)
     return ChordSymbolData(
-        interval_names=sort_interval_names(validated_intervals),
+        interval_names=interval_names,
         chord_symbol=symbol,
-        configuration=validated_config
+        configuration=style.to_ChordStyle()
     )
 
 
+@lru_cache(maxsize=4096)
+def _encode_chord(interval_names: tuple[str, ...], style: _SymbolStyle) -> tuple[tuple[str, ...], str]:
+    '''
+    Get the sorted interval names and the chord symbol for the given
+    validated interval names.
+    '''
+    symbol = encode_chord_symbol(interval_names, style.to_ChordStyle())
+    return sort_interval_names(interval_names), symbol
+
+
 def get_chord_from_symbol(chord_symbol: str) -> ChordData:
     '''
     Generate data about a chord's configuration based on its chord symbol.
@@ -355,4 +520,13 @@ def get_chord_from_symbol(chord_symbol: str) -> ChordData:
 
     TODO: Examples
     '''
-    return resolve_chord_symbol(chord_symbol)
+    return _resolve_chord_symbol(chord_symbol).to_ChordData()
+
+
+@lru_cache(maxsize=2048)
+def _resolve_chord_symbol(chord_symbol: str) -> _FrozenChord:
+    '''
+    Resolve a chord symbol for ``get_chord_from_symbol``. The symbol is
+    validated by the parser itself, which raises for any invalid input.
+    '''
+    return _FrozenChord.from_ChordData(resolve_chord_symbol(chord_symbol))
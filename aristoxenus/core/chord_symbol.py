@@ -1,4 +1,6 @@
 import re
+from functools import lru_cache
+from itertools import product
 from typing import Iterable, Optional
 
 from aristoxenus.core.annotations import ChordStyle
@@ -56,6 +58,54 @@ from aristoxenus.core.interval import (
 )
 from aristoxenus.core.validation import validate_alphabetic_name
 
+# The pattern is anchored at both ends, so a match is all that is needed.
+_CHORD_SYMBOL_RE = re.compile(RE_PARSE_CHORD_SYMBOL)
+
+_DIM7_STRUCTURE = frozenset((CHORD_FLAT_3, CHORD_FLAT_5, CHORD_DOUBLE_FLAT_7))
+_DOM7_STRUCTURE = frozenset((CHORD_3, CHORD_FLAT_7))
+_NATURAL_EXTENSIONS = (CHORD_9, CHORD_11, CHORD_13)
+# The intervals implied by each extension symbol, depending on whether the
+# chord has a major, flat, or double-flat 7.
+_EXTENSIONS = (CHORD_7, CHORD_9, CHORD_11, CHORD_13)
+_DOMINANT_EXTENSIONS = (CHORD_FLAT_7, CHORD_9, CHORD_11, CHORD_13)
+_DIMINISHED_EXTENSIONS = (CHORD_DOUBLE_FLAT_7, CHORD_9, CHORD_11, CHORD_13)
+# An interval name in the modifications of a chord symbol, with an optional
+# 'add' or 'no' prefix.
+_MODIFICATION_NUMBERS = ('13', '11', '9', '6', '5', '4', '3', '2')
+_MODIFICATION_RE = re.compile(
+    f"({CHORD_ADD}|{CHORD_NO}|)([#b]?(?:{'|'.join(_MODIFICATION_NUMBERS)}))")
+_MODIFICATION_ORDER = {
+    accidental + number: i for i, (number, accidental) in enumerate(product(
+        _MODIFICATION_NUMBERS, (SHARP_SYMBOL, FLAT_SYMBOL, EMPTY_STRING)))
+}
+_PREFIX_ORDER = {CHORD_ADD: 0, CHORD_NO: 1, EMPTY_STRING: 2}
+_ALTERED_FIFTHS = frozenset((CHORD_SHARP_5, CHORD_FLAT_5))
+# The legal intervals, in order of preference.
+_LEGAL_THIRDS = tuple(CHORD_LEGAL_THIRD)
+_LEGAL_ALT5S = tuple(CHORD_LEGAL_ALT5)
+_LEGAL_SUS = tuple(CHORD_LEGAL_SUS)
+# Fixed sub-symbols, built once rather than concatenated on every call.
+_SUS_SYMBOLS = {x: CHORD_SUS + x for x in _LEGAL_SUS}
+_NO3_SYMBOL = CHORD_NO + CHORD_3
+_NO5_SYMBOL = CHORD_NO + CHORD_5
+_NO_BB7_SYMBOL = CHORD_NO + CHORD_DOUBLE_FLAT_7
+# The suspensions recognized when decoding, with their symbols.
+_DECODED_SUS_SYMBOLS = tuple(
+    (x, _SUS_SYMBOLS[x])
+    for x in (CHORD_DOUBLE_FLAT_3, CHORD_SHARP_3, CHORD_4, CHORD_2))
+
+
+def _interval_order(interval_name: str) -> tuple[bool, int, str]:
+    '''
+    Sort key that orders interval names by their number. Unlike
+    ``sort_interval_names``, it accepts any accidentals (e.g. 'b11').
+    Names without a number are sorted last, by name.
+    '''
+    degree = interval_name.lstrip(SHARP_SYMBOL + FLAT_SYMBOL)
+    if not degree.isdecimal():
+        return True, 0, interval_name
+    return False, int(degree), interval_name
+
 
 def encode_chord_symbol(interval_names: Iterable[str], style: Optional[ChordStyle] = None) -> str:
     '''
@@ -77,6 +127,7 @@ def encode_chord_symbol(interval_names: Iterable[str], style: Optional[ChordStyl
     ----------
     interval_names: Iterable[str]
         The interval names (e.g. '1', 'b3', etc.) you want to parse as a chord.
+        A frozenset is used as it is, without being copied.
     maj_symbol : str, optional
         What symbol will represent major chords, by default "maj"
     min_symbol : str, optional
@@ -85,13 +136,21 @@ def encode_chord_symbol(interval_names: Iterable[str], style: Optional[ChordStyl
         What symbol will represent diminished chords, by default "dim"
     '''
     style = style or {}
-    maj_symbol = style.get(MAJ_SYMBOL, CHORD_MAJ)
-    min_symbol = style.get(MIN_SYMBOL, CHORD_MIN)
-    dim_symbol = style.get(DIM_SYMBOL, CHORD_DIM)
-    dim7_structure = [CHORD_FLAT_3, CHORD_FLAT_5, CHORD_DOUBLE_FLAT_7]
-    dom7_structure = [CHORD_3, CHORD_FLAT_7]
-    natural_extensions = [CHORD_9, CHORD_11, CHORD_13]
+    return _encode_chord_symbol(
+        frozenset(interval_names),
+        style.get(MAJ_SYMBOL, CHORD_MAJ),
+        style.get(MIN_SYMBOL, CHORD_MIN),
+        style.get(DIM_SYMBOL, CHORD_DIM)
+    )
+
 
+@lru_cache(maxsize=4096)
+def _encode_chord_symbol(interval_names: frozenset[str], maj_symbol: str, min_symbol: str, dim_symbol: str) -> str:
+    '''
+    Build the chord symbol for ``encode_chord_symbol``. The interval names
+    are treated as a set anyway, so they are cached as a frozenset, along
+    with the only style options that affect the symbol.
+    '''
     parse = set(interval_names)
 
     # A chord symbol is made up of a series of suffixes, each of which
@@ -106,7 +165,7 @@ def encode_chord_symbol(interval_names: Iterable[str], style: Optional[ChordStyl
     sus: str = EMPTY_STRING
     alt5: str = EMPTY_STRING
     alt7: str = EMPTY_STRING
-    add: str = EMPTY_STRING
+    add: list[str] = []
     no5: str = EMPTY_STRING
     no3: str = EMPTY_STRING
     extensions: str = EMPTY_STRING
@@ -115,45 +174,25 @@ def encode_chord_symbol(interval_names: Iterable[str], style: Optional[ChordStyl
     # will not be misunderstood later.
     parse.discard(str(1))
 
-    # Convenience functions to help categorize the base structure.
-    def has_third() -> Optional[str]:
-        for x in CHORD_LEGAL_THIRD:
-            if x in interval_names:
-                return x
-        return None
-
-    def has_p5() -> Optional[str]:
-        if CHORD_5 in interval_names:
-            return CHORD_5
-        return None
-
-    def has_alt5() -> Optional[str]:
-        for x in CHORD_LEGAL_ALT5:
-            if x in interval_names:
-                return x
-        return None
-
-    def is_dim() -> bool:
-        return set(dim7_structure).issubset(interval_names)
-
-    def is_dom() -> bool:
-        return set(dom7_structure).issubset(interval_names)
-
-    def has_sus() -> Optional[tuple[str, ...]]:
-        candidates: list[str] = []
-        for x in CHORD_LEGAL_SUS:
-            if x in interval_names:
-                candidates.append(x)
-        if candidates:
-            return tuple(candidates)
-        return None
+    # Categorize the base structure. The interval names are a frozenset, so
+    # each of these is a handful of hash lookups.
+    third = next((x for x in _LEGAL_THIRDS if x in interval_names), None)
+    altered_fifth = next(
+        (x for x in _LEGAL_ALT5S if x in interval_names), None)
+    suspensions = [x for x in _LEGAL_SUS if x in interval_names]
+    # The rarest interval of each structure is tested first, so that most
+    # chords are ruled out by a single lookup.
+    dim7 = (CHORD_DOUBLE_FLAT_7 in interval_names
+            and CHORD_FLAT_5 in interval_names
+            and CHORD_FLAT_3 in interval_names)
+    dom7 = CHORD_FLAT_7 in interval_names and CHORD_3 in interval_names
 
     # Pre-handle special cases.
     # Diminished chord implies specific structure.
-    if is_dim():
+    if dim7:
         normal3 = dim_symbol
         primary = CHORD_7
-        parse.difference_update(set(dim7_structure))
+        parse.difference_update(_DIM7_STRUCTURE)
     else:
         # Exotic chords are allowed to have bb7 in our system, but since the
         # bb accidental might conflict with the note name in a 7th chord
@@ -164,19 +203,19 @@ def encode_chord_symbol(interval_names: Iterable[str], style: Optional[ChordStyl
             parse.discard(CHORD_DOUBLE_FLAT_7)
         # A chord with an altered 5th must always have an explicit alt5 symbol,
         # unless it's diminished.
-        if (n := has_alt5()):
-            alt5 = n
-            parse.discard(n)
+        if altered_fifth:
+            alt5 = altered_fifth
+            parse.discard(altered_fifth)
         # A chord with no 5th must have an explicit no5 symbol.
-        elif not has_p5():
-            no5 = CHORD_NO + CHORD_5
+        elif CHORD_5 not in interval_names:
+            no5 = _NO5_SYMBOL
         else:
             # The fifth is implied in any other chord and has no symbol.
             parse.discard(CHORD_5)
     # Dominant chord implies specific structure.
-    if is_dom():
+    if dom7:
         primary = CHORD_7
-        parse.difference_update(set(dom7_structure))
+        parse.difference_update(_DOM7_STRUCTURE)
 
     # Main chord parsing is mostly a 1:1 symbol matching, with a few
     # exceptions.
@@ -184,16 +223,16 @@ def encode_chord_symbol(interval_names: Iterable[str], style: Optional[ChordStyl
     # Chords in our system are always given an explicit symbol for
     # their third, unless they are one of the implicit symbols
     # above, or they have a suspension in place of a third.
-    if (n := has_third()):
-        if is_dim() or is_dom():
+    if third:
+        if dim7 or dom7:
             pass
-        elif n == CHORD_3:
+        elif third == CHORD_3:
             normal3 = maj_symbol
             # A 7 symbol in a major chord implies a natural 7
             if CHORD_7 in parse:
                 primary = CHORD_7
                 parse.discard(CHORD_7)
-        elif n == CHORD_FLAT_3:
+        elif third == CHORD_FLAT_3:
             normal3 = min_symbol
             # A 7 symbol in most chords implies a flat 7, so
             # the natural 7 requires a special symbol.
@@ -203,25 +242,24 @@ def encode_chord_symbol(interval_names: Iterable[str], style: Optional[ChordStyl
             if CHORD_FLAT_7 in parse:
                 parse.discard(CHORD_FLAT_7)
                 primary = CHORD_7
-        parse.discard(n)
+        parse.discard(third)
     # Our system allows for sus chords with notes that could technically be
     # considered thirds. We categorize #3 and bb3 as 'sus' chords a) because
     # they cannot reasonably be labeled major or minor, b) so that their
     # accidental cannot stand next to the root note (i.e. e.g. Dsusbb3 is less
     # ambiguous than Dbb3).
-    elif (candidates := has_sus()):
+    elif suspensions:
         # Normally, we expect to have only one medial note (a third or a
         # suspended note). If there's more than one note that could stand
         # as a suspension, treat the first as a suspension, and any others
         # as additions (e.g. 1, 2, 4, 5 -> sus2add4).
-        candidates = list(candidates)
-        main = candidates.pop(0)
-        sus = CHORD_SUS + main
+        main = suspensions.pop(0)
+        sus = _SUS_SYMBOLS[main]
         parse.discard(main)
-        for x in candidates:
+        for x in suspensions:
             if x:
-                add += CHORD_ADD + x
-                parse.discard(x)
+                add.extend((CHORD_ADD, x))
+        parse.difference_update(suspensions)
         if CHORD_7 in parse:
             parse.discard(CHORD_7)
             primary = maj_symbol + CHORD_7
@@ -230,7 +268,7 @@ def encode_chord_symbol(interval_names: Iterable[str], style: Optional[ChordStyl
             primary = CHORD_7
     # Any chord without a medial must have an explicit no3 symbol
     else:
-        no3 = CHORD_NO + CHORD_3
+        no3 = _NO3_SYMBOL
 
     # Our system treats primary extension symbols as implying ALL previous
     # extensions in the series, i.e. a 13 chord includes 7, 9, 11, 13.
@@ -240,17 +278,16 @@ def encode_chord_symbol(interval_names: Iterable[str], style: Optional[ChordStyl
     largest: str = EMPTY_STRING
     if primary:
         checked: list[str] = []
-        for i, extension in enumerate(natural_extensions):
-            prev = natural_extensions[i - 1] if i > 0 else None
+        for i, extension in enumerate(_NATURAL_EXTENSIONS):
+            prev = _NATURAL_EXTENSIONS[i - 1] if i > 0 else None
             if extension in parse:
                 if not prev or prev in checked:
                     largest = extension
-                    parse.discard(extension)
-                    checked.append(extension)
                 else:
-                    add += CHORD_ADD + extension
-                    parse.discard(extension)
-                    checked.append(extension)
+                    add.extend((CHORD_ADD, extension))
+                checked.append(extension)
+        # Every natural extension has now been handled one way or the other.
+        parse.difference_update(_NATURAL_EXTENSIONS)
         if largest:
             primary = primary.replace(CHORD_7, largest)
 
@@ -262,20 +299,21 @@ def encode_chord_symbol(interval_names: Iterable[str], style: Optional[ChordStyl
 
     # If the primary suffix already exists, treat the 6 as an addition.
     if secondary and primary:
-        add += CHORD_ADD + secondary
+        add.extend((CHORD_ADD, secondary))
         secondary = EMPTY_STRING
 
     # Any extension with an accidental can simply be suffixed on its own.
     # Natural extensions may encounter ambiguities and must be treated as
     # additions (e.g. Emaj7#11 vs Emaj711, better: Emaj7add11)
-    for extension in list(parse):
-        if not any([SHARP_SYMBOL in extension, FLAT_SYMBOL in extension]):
-            add += CHORD_ADD + extension
-            parse.discard(extension)
-
-    # By this point, the list of intervals only contains non-chord tone
-    # extensions with accidentals.
-    extensions = EMPTY_STRING.join(parse)
+    # The remaining intervals are sorted, so that the symbol does not depend
+    # on the iteration order of the set.
+    altered: list[str] = []
+    for extension in sorted(parse, key=_interval_order):
+        if SHARP_SYMBOL in extension or FLAT_SYMBOL in extension:
+            altered.append(extension)
+        else:
+            add.extend((CHORD_ADD, extension))
+    extensions = EMPTY_STRING.join(altered)
 
     # Most suffixes will be empty strings in any given chord.
     symbols: list[str] = [
@@ -288,11 +326,12 @@ def encode_chord_symbol(interval_names: Iterable[str], style: Optional[ChordStyl
         alt5,
         alt7,
         extensions,
-        add
+        EMPTY_STRING.join(add)
     ]
     return EMPTY_STRING.join(symbols)
 
 
+@lru_cache(maxsize=2048)
 def decode_chord_symbol(chord_symbol: str) -> tuple[str, ...]:
     '''
     Parse a chord symbol into a list of interval names.
@@ -333,18 +372,10 @@ def decode_chord_symbol(chord_symbol: str) -> tuple[str, ...]:
     #
     # After this, we have most information about a chord, and just need to
     # check edge cases and transform symbols into interval names.
-    match = re.search(RE_PARSE_CHORD_SYMBOL, chord_symbol)
-    if match is None:
+    groups = _split_chord_symbol(chord_symbol)
+    if groups is None:
         raise StringValidationError(chord_symbol, CHORD_SYMBOL)
-
-    root = match.group(NOTE_NAME)
-    main = match.group(MAIN)
-    extension = match.group(EXTENSION)
-    modifications = match.group(MODIFICATION)
-    slash = match.group(SLASH)
-    ext_series: list[str] = [CHORD_7, CHORD_9, CHORD_11, CHORD_13]
-    sus_intervals: list[str] = [
-        CHORD_DOUBLE_FLAT_3, CHORD_SHARP_3, CHORD_4, CHORD_2]
+    root, main, extension, modifications, slash = groups
 
     # Slash chords must use alphabetic names.
     if slash is not None:
@@ -355,22 +386,18 @@ def decode_chord_symbol(chord_symbol: str) -> tuple[str, ...]:
     if main is None:
         intervals.add(CHORD_3)
         # 'C7', 'A11', 'F#13'
-        if extension in ext_series:
-            i = ext_series.index(extension) + 1
-            for interval in ext_series[:i]:
-                if interval == CHORD_7:
-                    interval = CHORD_FLAT_7
-                intervals.add(interval)
+        if extension in _EXTENSIONS:
+            i = _EXTENSIONS.index(extension) + 1
+            intervals.update(_DOMINANT_EXTENSIONS[:i])
             extension = None
 
     # Major chords, e.g. 'Cmaj', 'AM', 'F#Δ'
     elif main in CHORD_MAJOR_SYMBOLS:
         intervals.add(CHORD_3)
         # Major 7 implies natural 7, e.g. 'Cmaj7', 'AM7', 'F#Δ7'
-        if extension in ext_series:
-            i = ext_series.index(extension) + 1
-            for interval in ext_series[:i]:
-                intervals.add(interval)
+        if extension in _EXTENSIONS:
+            i = _EXTENSIONS.index(extension) + 1
+            intervals.update(_EXTENSIONS[:i])
             extension = None
 
     # Diminished chords, e.g. 'Cdim', 'Ao'
@@ -379,12 +406,9 @@ def decode_chord_symbol(chord_symbol: str) -> tuple[str, ...]:
         intervals.add(CHORD_FLAT_5)
         intervals.discard(CHORD_5)
         # Diminished 7 implies bb7, e.g. 'Cdim7', 'Ao9'
-        if extension in ext_series:
-            i = ext_series.index(extension) + 1
-            for interval in ext_series[:i]:
-                if interval == CHORD_7:
-                    interval = CHORD_DOUBLE_FLAT_7
-                intervals.add(interval)
+        if extension in _EXTENSIONS:
+            i = _EXTENSIONS.index(extension) + 1
+            intervals.update(_DIMINISHED_EXTENSIONS[:i])
             extension = None
 
     # Augmented chords, e.g. 'Caug', 'A+'
@@ -409,58 +433,43 @@ def decode_chord_symbol(chord_symbol: str) -> tuple[str, ...]:
         for symb in CHORD_MAJOR_SYMBOLS:
             if symb in extension:
                 base = extension.replace(symb, EMPTY_STRING)
-                if base in ext_series:
-                    i = ext_series.index(base) + 1
-                    for interval in ext_series[:i]:
-                        intervals.add(interval)
-        if extension in ext_series:
-            i = ext_series.index(extension) + 1
-            for interval in ext_series[:i]:
-                if interval == CHORD_7:
-                    interval = CHORD_FLAT_7
-                intervals.add(interval)
+                if base in _EXTENSIONS:
+                    i = _EXTENSIONS.index(base) + 1
+                    intervals.update(_EXTENSIONS[:i])
+        if extension in _EXTENSIONS:
+            i = _EXTENSIONS.index(extension) + 1
+            intervals.update(_DOMINANT_EXTENSIONS[:i])
 
     # Check modifications
     sub: list[str] = []
     if modifications:
         # Special chords in our system might have sus bb3, #3.
-        for sus in sus_intervals:
-            if (n := CHORD_SUS + sus) in modifications:
-                modifications.replace(n, EMPTY_STRING)
+        for sus, symbol in _DECODED_SUS_SYMBOLS:
+            if symbol in modifications:
                 intervals.add(sus)
                 sub.extend([CHORD_3, CHORD_FLAT_3])
 
         # Special chords in our system might have bb7.
         if CHORD_DOUBLE_FLAT_7 in modifications:
-            if (n := CHORD_NO + CHORD_DOUBLE_FLAT_7) in modifications:
+            if _NO_BB7_SYMBOL in modifications:
                 sub.append(CHORD_DOUBLE_FLAT_7)
-                modifications.replace(n, '')
             else:
-                if (n := CHORD_ADD + CHORD_DOUBLE_FLAT_7) in modifications:
-                    intervals.add(CHORD_DOUBLE_FLAT_7)
-                    modifications.replace(n, EMPTY_STRING)
-                else:
-                    intervals.add(CHORD_DOUBLE_FLAT_7)
-                    modifications.replace(CHORD_DOUBLE_FLAT_7, EMPTY_STRING)
+                intervals.add(CHORD_DOUBLE_FLAT_7)
 
         # Most remaining symbols will be a bare interval name, an addition, or
-        # a subtraction.
-        INTERVALS = (13, 11, 9, 6, 5, 4, 3, 2)
-        for number in INTERVALS:
-            for accidental in [SHARP_SYMBOL, FLAT_SYMBOL, EMPTY_STRING]:
-                interval = accidental + str(number)
-                if (n := CHORD_ADD + interval) in modifications:
-                    intervals.add(interval)
-                    modifications = modifications.replace(n, EMPTY_STRING)
-                if (n := CHORD_NO + interval) in modifications:
-                    sub.append(interval)
-                    modifications = modifications.replace(n, EMPTY_STRING)
-                if interval in modifications:
-                    intervals.add(interval)
-                    modifications = modifications.replace(
-                        interval, EMPTY_STRING)
-                    if interval in [CHORD_SHARP_5, CHORD_FLAT_5]:
-                        intervals.remove(CHORD_5)
+        # a subtraction, which are all found in a single pass. They are then
+        # handled from the largest interval down, so that an altered fifth
+        # is always handled before a natural one.
+        mods = sorted(
+            _MODIFICATION_RE.findall(modifications),
+            key=lambda mod: (_MODIFICATION_ORDER[mod[1]], _PREFIX_ORDER[mod[0]]))
+        for prefix, interval in mods:
+            if prefix == CHORD_NO:
+                sub.append(interval)
+                continue
+            intervals.add(interval)
+            if not prefix and interval in _ALTERED_FIFTHS:
+                intervals.discard(CHORD_5)
 
         # Augmented symbols are either main or modification, e.g. Caug7 vs. C7aug
         for aug in CHORD_AUGMENTED_SYMBOLS:
@@ -471,8 +480,7 @@ def decode_chord_symbol(chord_symbol: str) -> tuple[str, ...]:
     # Subtractions are treated last in case they depend on an implication
     # in a preceding symbol.
     for s in sub:
-        if s in intervals:
-            intervals.remove(s)
+        intervals.discard(s)
 
     # If we have a slash chord, we need to make sure that the slashed interval
     # is actually present before we try to rotate to make it the bass. If not,
@@ -490,6 +498,17 @@ def decode_chord_symbol(chord_symbol: str) -> tuple[str, ...]:
     return sort_interval_names(intervals)
 
 
+def _split_chord_symbol(chord_symbol: str) -> Optional[tuple[Optional[str], ...]]:
+    '''
+    Return the root, main, extension, modification and slash groups of a
+    chord symbol, or None if the symbol does not match the pattern.
+    '''
+    match = _CHORD_SYMBOL_RE.match(chord_symbol)
+    if match is None:
+        return None
+    return match.group(NOTE_NAME, MAIN, EXTENSION, MODIFICATION, SLASH)
+
+
 def get_chord_style(chord_symbol: str) -> ChordStyle:
     '''
     Attempt to extract chord style information from a given chord symbol.
@@ -511,19 +530,29 @@ def get_chord_style(chord_symbol: str) -> ChordStyle:
         If the chord symbol cannot be parsed.
     '''
     # TODO: write tests
-    match = re.search(RE_PARSE_CHORD_SYMBOL, chord_symbol)
-    if match is None:
+    return _get_chord_style(chord_symbol).copy()
+
+
+@lru_cache(maxsize=2048)
+def _get_chord_style(chord_symbol: str) -> ChordStyle:
+    '''
+    Extract the style for ``get_chord_style``, which returns a copy of the
+    cached dictionary.
+    '''
+    groups = _split_chord_symbol(chord_symbol)
+    if groups is None:
         raise StringValidationError(chord_symbol, CHORD_SYMBOL)
+    _, main, extension, _, _ = groups
     style: ChordStyle = {}
     if SLASH_SYMBOL in chord_symbol:
         style[SLASH] = True
     for maj in CHORD_MAJOR_SYMBOLS:
-        if match.group(MAIN) == maj or maj in match.group(EXTENSION):
+        if main == maj or maj in extension:
             style[MAJ_SYMBOL] = maj
     for minor in CHORD_MINOR_SYMBOLS:
-        if match.group(MAIN) == minor:
+        if main == minor:
             style[MIN_SYMBOL] = minor
     for dim in CHORD_DIM_SYMBOLS:
-        if match.group(MAIN) == dim:
+        if main == dim:
             style[DIM_SYMBOL] = dim
     return style
@@ -3,7 +3,8 @@ This module contains functions that generate chord scales from scale
 and note precursors.
 '''
 
-from typing import Iterable, Optional
+from operator import itemgetter
+from typing import Callable, Iterable, Optional, Sequence
 
 from aristoxenus.core.annotations import (
     ChordData,
@@ -18,9 +19,15 @@ from aristoxenus.core.heptatonic_spelling import (
 from aristoxenus.core.constants import NOTES
 from aristoxenus.core.errors import ArgumentError
 from aristoxenus.core.interval import get_double_octave
-from aristoxenus.core.note_name import decode_note_name
 from aristoxenus.core.rotate import rotate_interval_structure
 
+# The scale indices of a sus chord's notes, where the third is replaced by
+# the suspended scale degree.
+_SUS_PATTERNS = {
+    2: (0, 1, 4, 6, 8, 10, 12),
+    4: (0, 3, 4, 6, 8, 10, 12)
+}
+
 
 def chordify_heptatonic_tertial(keynote: NoteNameData, interval_structure: Iterable[int], number_of_notes: int, chord_style: Optional[ChordStyle] = None) -> tuple[ChordData, ...]:
     '''
@@ -52,32 +59,35 @@ def chordify_heptatonic_tertial(keynote: NoteNameData, interval_structure: Itera
             f"Chords can be generated with a maximum of 7 notes ({number_of_notes=}).")
     chords: list[ChordData] = []
     note_names = get_heptatonic_note_names(keynote, interval_structure)
+    gather = _gather(range(0, step * number_of_notes, step))
     interval_structure = tuple(interval_structure)
     for i in range(NOTES):
         root = note_names[i]
         chord_interval_structure = rotate_interval_structure(
             interval_structure, i)
-        root_data = decode_note_name(root)
-        modal_names = get_heptatonic_note_names(root_data,
-                                                 chord_interval_structure)
-        interval_symbols = get_heptatonic_interval_names(
-            chord_interval_structure)
+        # The mode built on this root is spelled with the same note names
+        # as the scale, so they only need to be rotated.
+        modal_names = note_names[i:] + note_names[:i]
         if number_of_notes > octave_fold:
             modal_names += modal_names
             interval_symbols = get_heptatonic_interval_names(
                 chord_interval_structure, octave=True)
             chord_interval_structure = get_double_octave(
                 chord_interval_structure)
+        else:
+            interval_symbols = get_heptatonic_interval_names(
+                chord_interval_structure)
 
+        ch_interval_symbols = gather(interval_symbols)
         chord_symbol = root + encode_chord_symbol(
-            interval_symbols[::step][:number_of_notes],
+            ch_interval_symbols,
             chord_style)
         chords.append(
             ChordData(
                 chord_symbol=chord_symbol,
-                note_names=modal_names[::step][:number_of_notes],
-                interval_names=interval_symbols[::step][:number_of_notes],
-                interval_structure=chord_interval_structure[::step][:number_of_notes]
+                note_names=gather(modal_names),
+                interval_names=ch_interval_symbols,
+                interval_structure=gather(chord_interval_structure)
             )
         )
     return tuple(chords)
@@ -110,7 +120,6 @@ def chordify_heptatonic_sus(keynote: NoteNameData, interval_structure: Iterable[
         A tuple of ChordData representing the requested chord scale.
     '''
     octave_fold = 4
-    step = 2
     if number_of_notes > NOTES:
         raise ArgumentError(
             f"Chords can be generated with a maximum of 7 notes ({number_of_notes=}).")
@@ -119,41 +128,46 @@ def chordify_heptatonic_sus(keynote: NoteNameData, interval_structure: Iterable[
 
     chords: list[ChordData] = []
     note_names = get_heptatonic_note_names(keynote, interval_structure)
-    pattern = list(range(13))[::step]
-    if sus == 2:
-        pattern[1] -= 1
-        # pattern = [0, 1, 4, 6, 8, 10, 12]
-    else:
-        pattern[1] += 1
-        # pattern = [0, 3, 4, 6, 8, 10, 12]
+    pattern = _SUS_PATTERNS[sus]
+    gather = _gather(pattern[:number_of_notes])
     interval_structure = tuple(interval_structure)
     for i in range(NOTES):
         root = note_names[i]
         chord_interval_structure = rotate_interval_structure(
             interval_structure, i)
-        root_data = decode_note_name(root)
-        modal_names = get_heptatonic_note_names(
-            root_data, chord_interval_structure)
-        interval_symbols = get_heptatonic_interval_names(
-            chord_interval_structure)
+        # The mode built on this root is spelled with the same note names
+        # as the scale, so they only need to be rotated.
+        modal_names = note_names[i:] + note_names[:i]
         if number_of_notes > octave_fold:
             modal_names += modal_names
             interval_symbols = get_heptatonic_interval_names(
                 chord_interval_structure, octave=True)
             chord_interval_structure = get_double_octave(
                 chord_interval_structure)
+        else:
+            interval_symbols = get_heptatonic_interval_names(
+                chord_interval_structure)
 
-        _pattern = pattern[:number_of_notes]
-        ch_note_names = [modal_names[i] for i in _pattern]
-        ch_interval_symbols = [interval_symbols[i] for i in _pattern]
-        ch_interval_structure = [chord_interval_structure[i] for i in _pattern]
+        ch_note_names = gather(modal_names)
+        ch_interval_symbols = gather(interval_symbols)
+        ch_interval_structure = gather(chord_interval_structure)
         ch_symbol = root + encode_chord_symbol(ch_interval_symbols, chord_style)
         chords.append(
             ChordData(
                 chord_symbol=ch_symbol,
-                note_names=tuple(ch_note_names),
-                interval_names=tuple(ch_interval_symbols),
-                interval_structure=tuple(ch_interval_structure)
+                note_names=ch_note_names,
+                interval_names=ch_interval_symbols,
+                interval_structure=ch_interval_structure
             )
         )
     return tuple(chords)
+
+
+def _gather(pattern: Sequence[int]) -> Callable[[Sequence], tuple]:
+    '''
+    Return a function that takes the elements at the pattern's indices from
+    a sequence, always as a tuple.
+    '''
+    if len(pattern) > 1:
+        return itemgetter(*pattern)
+    return lambda sequence: tuple(sequence[i] for i in pattern)
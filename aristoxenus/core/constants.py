@@ -1,4 +1,6 @@
 '''Constants used in the program.'''
+from types import MappingProxyType
+from typing import Mapping
 
 ##############
 # Raw Values #
@@ -125,7 +127,9 @@ DIM_SYMBOL = 'dim_symbol'
 ##############
 # Scaleforms #
 ##############
-HEPTATONIC_SCALES = {
+# The lookup tables are read-only views, so that no caller can alter the
+# library's data (or the results cached from it) by accident.
+HEPTATONIC_SCALES: Mapping[str, tuple[int, ...]] = MappingProxyType({
     DIATONIC: (0, 2, 4, 5, 7, 9, 11),
     ALTERED: (0, 1, 3, 4, 6, 8, 10),
     HEMITONIC: (0, 1, 4, 5, 7, 9, 11),
@@ -141,27 +145,27 @@ HEPTATONIC_SCALES = {
     HUNGARIAN: (0, 3, 4, 6, 7, 9, 10),
     PERSIAN: (0, 1, 4, 5, 6, 8, 11),
     ROMANIAN: (0, 1, 4, 6, 7, 9, 10)
-}
-BARRY_HARRIS_SCALES = {
+})
+BARRY_HARRIS_SCALES: Mapping[str, tuple[int, ...]] = MappingProxyType({
     MAJ_6_DIMINISHED: (0, 2, 4, 5, 7, 8, 9, 11),
     MIN_6_DIMINISHED: (0, 2, 3, 5, 7, 8, 9, 11),
     DOM_7_DIMINISHED: (0, 2, 4, 5, 7, 8, 10, 11),
     DOM_7_FLAT_5_DIMINISHED: (0, 2, 4, 5, 6, 8, 10, 11)
-}
-HEXATONIC_SCALES = {
+})
+HEXATONIC_SCALES: Mapping[str, tuple[int, ...]] = MappingProxyType({
     ISTRIAN: (0, 1, 3, 4, 6, 7),
     WHOLE_TONE: (0, 2, 4, 6, 8, 10),
     BLUES: (0, 3, 5, 6, 7, 10),
     MAJOR_BLUES: (0, 2, 3, 4, 7, 9)
-}
-PENTATONIC_SCALES = {
+})
+PENTATONIC_SCALES: Mapping[str, tuple[int, ...]] = MappingProxyType({
     MINOR_PENTATONIC: (0, 3, 5, 7, 10),
     PELOG_PENTATONIC: (0, 1, 3, 7, 8),
     IN: (0, 1, 5, 7, 8),
     INSEN: (0, 1, 5, 7, 10),
     IWATO: (0, 1, 5, 6, 10),
     DOMINANT_PENTATONIC:  (0, 2, 4, 7, 10)
-}
+})
 
 #######################
 # Chord Voicing Forms #
@@ -172,13 +176,13 @@ DROP_2_AND_3_VOICING: tuple[int, ...] = (2,)     # 1375 c e g b -> c e b g
 DROP_3_VOICING: tuple[int, ...] = (1, 2)         # 1735 c e g b -> c b e g
 SPREAD_TRIAD = DROP_2_VOICING                    # 153  c e g   -> c g e
 
-VOICINGS: dict[str, tuple[int, ...]] = {
+VOICINGS: Mapping[str, tuple[int, ...]] = MappingProxyType({
         OPEN: DROP_2_VOICING,
         D2: DROP_2_VOICING,
         D3: DROP_3_VOICING,
         D23: DROP_2_AND_3_VOICING,
         D24: DROP_2_AND_4_VOICING
-    }
+    })
 
 #################
 # Chord Symbols #
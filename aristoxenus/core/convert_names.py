@@ -3,6 +3,7 @@ This module contains functions that convert names in one format into a
 different format.
 '''
 
+from functools import lru_cache
 from typing import Iterable, Sequence
 
 from aristoxenus.core.roman_numeral import encode_roman_numeral
@@ -11,8 +12,10 @@ from aristoxenus.core.annotations import (
     NoteNameData
 )
 from aristoxenus.core.constants import (
+    DIATONIC,
     EMPTY_STRING,
     FLAT_SYMBOL,
+    HEPTATONIC_SCALES,
     NATURAL_NAMES,
     NOTE_NAME,
     NOTES,
@@ -28,13 +31,29 @@ from aristoxenus.core.interval import calculate_interval
 from aristoxenus.core.errors import (
     StringValidationError
 )
-from aristoxenus.core.note_name import encode_note_name
 from aristoxenus.core.validation import (
     validate_alphabetic_name,
     validate_interval_name,
     validate_roman_name
 )
 
+# The digits of the heptatonic degrees, paired with their Roman numerals.
+_ROMAN_NUMERALS = tuple(
+    (str(number), encode_roman_numeral(number)) for number in range(1, 8))
+_LOWER_ROMAN_NUMERALS = tuple((n, r.lower()) for n, r in _ROMAN_NUMERALS)
+# An interval name is its accidentals followed by its degree, so stripping
+# these leaves only the digits.
+_ACCIDENTAL_SYMBOLS = SHARP_SYMBOL + FLAT_SYMBOL
+_STRIP_ACCIDENTALS = str.maketrans(EMPTY_STRING, EMPTY_STRING, _ACCIDENTAL_SYMBOLS)
+# The pitch class of every note name with up to four sharps or flats, which
+# covers any name that a heptatonic spelling can produce.
+_PITCH_CLASSES = {
+    natural + symbol * count: (pitch + sign * count) % TONES
+    for natural, pitch in zip(NATURAL_NAMES, HEPTATONIC_SCALES[DIATONIC])
+    for symbol, sign in ((SHARP_SYMBOL, 1), (FLAT_SYMBOL, -1))
+    for count in range(5)
+}
+
 
 def convert_interval_names_to_roman_names(interval_names: Iterable[str] | str) -> tuple[str, ...]:
     '''
@@ -61,12 +80,23 @@ def convert_interval_names_to_roman_names(interval_names: Iterable[str] | str) -
     if isinstance(interval_names, str):
         interval_names = [interval_names]
     for interval in interval_names:
-        if not validate_interval_name(interval):
-            raise StringValidationError(interval, INTERVAL_NAME)
-        for number in range(1, 8):
-            if (x := str(number)) in interval:
-                r = encode_roman_numeral(number)
-                roman_intervals.append(interval.replace(x, r))
+        roman_intervals.extend(_interval_name_to_roman_names(interval))
+    return tuple(roman_intervals)
+
+
+@lru_cache(maxsize=256)
+def _interval_name_to_roman_names(interval: str) -> tuple[str, ...]:
+    '''
+    Convert a single interval name for ``convert_interval_names_to_roman_names``.
+    The result is a tuple, since a compound name (e.g. '13') produces one
+    Roman name for each digit it contains.
+    '''
+    if not validate_interval_name(interval):
+        raise StringValidationError(interval, INTERVAL_NAME)
+    roman_intervals: list[str] = []
+    for x, r in _ROMAN_NUMERALS:
+        if x in interval:
+            roman_intervals.append(interval.replace(x, r))
     return tuple(roman_intervals)
 
 
@@ -94,21 +124,27 @@ def convert_roman_names_to_interval_names(roman_names: Iterable[str] | str) -> t
     indian_intervals: list[str] = []
     if isinstance(roman_names, str):
         roman_names = [roman_names]
-    for roman_name in [x.lower() for x in roman_names]:
-        if not validate_roman_name(roman_name):
-            raise StringValidationError(roman_name, ROMAN_NAME)
-        for number in reversed(range(1, 8)):
-            numeral = (encode_roman_numeral(number).lower())
-            base = (roman_name
-                    .replace(SHARP_SYMBOL, EMPTY_STRING)
-                    .replace(FLAT_SYMBOL, EMPTY_STRING))
-            if base == numeral:
-                n = str(number)
-                indian_intervals.append(roman_name.replace(numeral, n))
-                break
+    for roman_name in roman_names:
+        indian_intervals.extend(_roman_name_to_interval_names(roman_name.lower()))
     return tuple(indian_intervals)
 
 
+@lru_cache(maxsize=256)
+def _roman_name_to_interval_names(roman_name: str) -> tuple[str, ...]:
+    '''
+    Convert a single lowercase Roman name for
+    ``convert_roman_names_to_interval_names``. The result is a tuple, which
+    is empty if the numeral is out of range.
+    '''
+    if not validate_roman_name(roman_name):
+        raise StringValidationError(roman_name, ROMAN_NAME)
+    base = roman_name.translate(_STRIP_ACCIDENTALS)
+    for n, numeral in reversed(_LOWER_ROMAN_NUMERALS):
+        if base == numeral:
+            return (roman_name.replace(numeral, n),)
+    return ()
+
+
 def convert_interval_names_to_note_names(root: NoteNameData, interval_names: Iterable[str] | str) -> tuple[str, ...]:
     '''
     Return the note names that correspond to the given interval symbols, from
@@ -134,27 +170,24 @@ def convert_interval_names_to_note_names(root: NoteNameData, interval_names: Ite
     '''
     if isinstance(interval_names, str):
         interval_names = [interval_names]
+    # The scale is spelled from the root, so the root is always its first
+    # note, and a negative index (for 7ths) wraps around to the last note.
     scale = get_heptatonic_note_names(root)
-    start = scale.index(encode_note_name(root))
-    sequence = scale[start:] + scale[:start]
     names: list[str] = []
-
-    def __n(symbol: str) -> int:
-        return int(''.join(c for c in symbol if c.isdigit()))
     for interval in interval_names:
         if not validate_interval_name(interval):
             raise StringValidationError(interval, INTERVAL_NAME)
-        index = (__n(interval) % NOTES) - 1
-        sh = SHARP_SYMBOL*interval.count(SHARP_SYMBOL)
-        fl = FLAT_SYMBOL*interval.count(FLAT_SYMBOL)
-        name = sequence[index] + sh + fl
-        while True:
-            if (s := SHARP_SYMBOL + FLAT_SYMBOL) in name:
-                name = name.replace(s, '')
-            elif (s := FLAT_SYMBOL + SHARP_SYMBOL) in name:
-                name = name.replace(s, '')
-            else:
-                break
+        index = (int(interval.lstrip(_ACCIDENTAL_SYMBOLS)) % NOTES) - 1
+        # Sharps and flats cancel out, so only the balance of the scale
+        # note's accidentals and the interval's accidentals is spelled.
+        note = scale[index]
+        accidentals = (note.count(SHARP_SYMBOL) - note.count(FLAT_SYMBOL)
+                       + interval.count(SHARP_SYMBOL)
+                       - interval.count(FLAT_SYMBOL))
+        if accidentals > 0:
+            name = note[0] + SHARP_SYMBOL * accidentals
+        else:
+            name = note[0] + FLAT_SYMBOL * (-accidentals)
         names.append(name)
     return tuple(names)
 
@@ -194,7 +227,9 @@ def convert_interval_names_to_integers(interval_names: Sequence[str] | str) -> t
     '''
     alpha: list[str] = []
     for interval in interval_names:
-        digit = EMPTY_STRING.join(x for x in interval if x.isdigit())
+        if not validate_interval_name(interval):
+            raise StringValidationError(interval, INTERVAL_NAME)
+        digit = interval.lstrip(_ACCIDENTAL_SYMBOLS)
         accidentals = interval.replace(digit, EMPTY_STRING)
         n = NATURAL_NAMES[(int(digit) - 1) % NOTES]
         alpha.append(n + accidentals)
@@ -223,15 +258,13 @@ def convert_note_names_to_interval_names(note_names: Sequence[str]) -> tuple[str
     StringValidationError
         If any of the note names cannot be parsed.
     '''
-    root = note_names[0]
-    if not validate_alphabetic_name(root):
-        raise StringValidationError(root, NOTE_NAME)
-    interval_names: list[str] = []
+    # The root is the first name, so checking every name also covers it.
     for note_name in note_names:
         if not validate_alphabetic_name(note_name):
             raise StringValidationError(note_name, NOTE_NAME)
-        interval_names.append(calculate_interval(root, note_name)[RELATIVE])
-    return tuple(interval_names)
+    root = note_names[0]
+    return tuple(calculate_interval(root, note_name)[RELATIVE]
+                 for note_name in note_names)
 
 
 def convert_note_names_to_integers(note_names: Sequence[str]) -> tuple[int, ...]:
@@ -253,13 +286,23 @@ def convert_note_names_to_integers(note_names: Sequence[str]) -> tuple[int, ...]
     tuple[int, ...]
         A tuple of integers representing the given note names.
     '''
-    note_names = list(note_names)
-    root = note_names.pop(0)
+    root = note_names[0]
+    root_pitch = _PITCH_CLASSES.get(root)
+    # Each distinct note name is measured against the root only once, since
+    # long sequences (e.g. progressions) repeat the same few names. Common
+    # names are measured from the table, and anything else is parsed.
+    absolutes: dict[str, int] = {}
+    for name in dict.fromkeys(note_names[1:]):
+        pitch = _PITCH_CLASSES.get(name)
+        if root_pitch is None or pitch is None:
+            absolutes[name] = calculate_interval(root, name)[ABSOLUTE]
+        else:
+            absolutes[name] = (pitch - root_pitch) % TONES
     intervals: list[int] = [0]
     modifier = 0
     highest = 0
-    for name in note_names:
-        interval = calculate_interval(root, name)[ABSOLUTE]
+    for name in note_names[1:]:
+        interval = absolutes[name]
         if (highest >= interval + modifier):
             modifier += TONES
         interval += modifier
@@ -1,6 +1,7 @@
 '''
 This module takes precursors and uses them to create new forms.
 '''
+from functools import lru_cache
 from typing import Iterable, Optional
 
 from aristoxenus.core.annotations import (
@@ -47,18 +48,32 @@ def get_heptatonic_note_names(keynote: Optional[NoteNameData] = None, interval_s
     '''
     if keynote is None:
         keynote = NoteNameData(note_name_index=0, accidentals=0)
-    interval_structure = tuple(interval_structure)
+    # The scale tables already hold tuples, which can be passed on as is.
+    if not isinstance(interval_structure, tuple):
+        interval_structure = tuple(interval_structure)
+    return _get_heptatonic_note_names(keynote[NOTE_NAME_INDEX],
+                                      keynote[ACCIDENTALS],
+                                      interval_structure)
+
+
+@lru_cache(maxsize=1024)
+def _get_heptatonic_note_names(note_name_index: int, accidentals: int, interval_structure: tuple[int, ...]) -> tuple[str, ...]:
+    '''
+    Spell the note names for the keynote given as its index and accidentals.
+    The arguments are hashable, so that the result can be cached.
+    '''
+    # The spelling is worked out on plain integers, and only the final names
+    # are encoded as strings.
+    diatonic = HEPTATONIC_SCALES[DIATONIC]
+    root_pitch: int = diatonic[note_name_index] + accidentals
     result: list[str] = []
-    root_pitch: int = HEPTATONIC_SCALES[DIATONIC][keynote[NOTE_NAME_INDEX]] + \
-        keynote[ACCIDENTALS]
     for i in range(NOTES):
-        new_note_idx = (i + keynote[NOTE_NAME_INDEX]) % NOTES
-        tones_offset = ((i + keynote[NOTE_NAME_INDEX]) // NOTES) * TONES
-        original_value = HEPTATONIC_SCALES[DIATONIC][new_note_idx]
-        relative_value = root_pitch + interval_structure[i]
-        accidentals = relative_value - (original_value + tones_offset)
+        octave, new_note_idx = divmod(i + note_name_index, NOTES)
+        note_accidentals = (root_pitch + interval_structure[i]
+                            - diatonic[new_note_idx] - octave * TONES)
         note_name = encode_note_name(
-            NoteNameData(note_name_index=new_note_idx, accidentals=accidentals))
+            NoteNameData(note_name_index=new_note_idx,
+                         accidentals=note_accidentals))
         result.append(note_name)
     return tuple(result)
 
@@ -86,11 +101,27 @@ def get_best_heptatonic_names(keynote: NoteNameData, interval_structure: Iterabl
     ArgumentError
         If the structure is not heptatonic.
     '''
+    if not isinstance(interval_structure, tuple):
+        interval_structure = tuple(interval_structure)
     if not validate_heptatonic_structure(interval_structure):
         raise ArgumentError(
             'This function is intended only for heptatonic scale forms.')
 
     note = simplify_note_name(keynote)
+    return _get_best_heptatonic_names(note[NOTE_NAME_INDEX],
+                                      note[ACCIDENTALS],
+                                      interval_structure)
+
+
+@lru_cache(maxsize=256)
+def _get_best_heptatonic_names(note_name_index: int, accidentals: int, interval_structure: tuple[int, ...]) -> tuple[str, ...]:
+    '''
+    Choose the best spelling for the simplified keynote given as its index
+    and accidentals. The arguments are hashable, so that the choice can be
+    cached.
+    '''
+    note = NoteNameData(note_name_index=note_name_index,
+                        accidentals=accidentals)
     # Naturals' default name is always the best.
     if is_enharmonically_natural(note):
         return get_heptatonic_note_names(note, interval_structure)
@@ -99,10 +130,8 @@ def get_best_heptatonic_names(keynote: NoteNameData, interval_structure: Iterabl
     k1, k2 = split_binomial_note(note)
     s1 = get_heptatonic_note_names(k1, interval_structure)
     s2 = get_heptatonic_note_names(k2, interval_structure)
-    s1_s = sum(n.count(SHARP_SYMBOL) for n in s1)
-    s1_f = sum(n.count(FLAT_SYMBOL) for n in s1)
-    s2_s = sum(n.count(SHARP_SYMBOL) for n in s2)
-    s2_f = sum(n.count(FLAT_SYMBOL) for n in s2)
+    s1_s, s1_f = _count_accidentals(s1)
+    s2_s, s2_f = _count_accidentals(s2)
     t1, t2 = (s1_s + s1_f), (s2_s + s2_f)
     m1, m2 = (s1_s > 0 and s1_f > 0), (s2_s > 0 and s2_f > 0)
     # Best key is usually as simple as fewest total accidentals.
@@ -119,11 +148,22 @@ def get_best_heptatonic_names(keynote: NoteNameData, interval_structure: Iterabl
             return s1
     # If both keys have the same number of sharps and flats, and they both
     # mix both types of accidentals, fall back arbitrarily to sharps.
-    if SHARP_SYMBOL in encode_note_name(k1):
+    if k1[ACCIDENTALS] > 0:
         return s1
     return s2
 
 
+def _count_accidentals(note_names: tuple[str, ...]) -> tuple[int, int]:
+    '''
+    Count the sharps and the flats in a spelling, in a single pass.
+    '''
+    sharps = flats = 0
+    for name in note_names:
+        sharps += name.count(SHARP_SYMBOL)
+        flats += name.count(FLAT_SYMBOL)
+    return sharps, flats
+
+
 def get_heptatonic_interval_names(interval_structure: Iterable[int] = HEPTATONIC_SCALES[DIATONIC], octave: bool = False) -> tuple[str, ...]:
     '''
     Return the numeric interval symbols for the given scale form.
@@ -146,20 +186,30 @@ def get_heptatonic_interval_names(interval_structure: Iterable[int] = HEPTATONIC
     ArgumentError
         If the structure is not heptatonic.
     '''
+    if not isinstance(interval_structure, tuple):
+        interval_structure = tuple(interval_structure)
+    return _get_heptatonic_interval_names(interval_structure, octave)
+
+
+@lru_cache(maxsize=1024)
+def _get_heptatonic_interval_names(interval_structure: tuple[int, ...], octave: bool) -> tuple[str, ...]:
+    '''
+    Spell the interval names for a structure given as a tuple, so that the
+    result can be cached.
+    '''
     if not validate_heptatonic_structure(interval_structure):
         raise ArgumentError(
             f'Interval structure must be heptatonic ({interval_structure=}).')
-    interval_structure = tuple(interval_structure)
     result: list[str] = []
     for i in range(NOTES if not octave else NOTES * 2):
         degree_name = (i % (TONES if not octave else TONES * 2)) + 1
         normal_value = HEPTATONIC_SCALES[DIATONIC][i % NOTES]
         actual_value = interval_structure[i % len(interval_structure)] % TONES
         accidentals = actual_value - normal_value
-        if accidentals > 0:
-            interval_name = SHARP_SYMBOL * (accidentals) + str(degree_name)
-        else:
-            interval_name = FLAT_SYMBOL * (-accidentals) + str(degree_name)
+        # At most one of the two runs of accidentals is non-empty.
+        interval_name = (SHARP_SYMBOL * max(accidentals, 0)
+                         + FLAT_SYMBOL * max(-accidentals, 0)
+                         + str(degree_name))
         result.append(interval_name)
     return tuple(result)
 
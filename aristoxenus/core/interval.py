@@ -1,7 +1,8 @@
 
+from functools import lru_cache
 from typing import Iterable
 
-from aristoxenus.core.annotations import IntervalData
+from aristoxenus.core.annotations import IntervalData, NoteNameData
 from aristoxenus.core.constants import (
     ACCIDENTALS, DIATONIC,
     EMPTY_STRING,
@@ -22,27 +23,38 @@ __all__ = [
     'get_double_octave'
 ]
 
+# The sort position of every supported interval name, shared by all calls.
+# Not an elegant way to do it, but there aren't a huge number of
+# intervals we need to support, even with the very exotic scales,
+# and time is better spent elsewhere.
+_INTERVAL_ORDER = {
+    "1": 0.0, 'b2': 0.11, '2': 0.12,
+    'bb3': 0.13, '#2': 0.135, 'b3': 0.14,
+    '3': 0.15, 'b4': 0.16, '#3': 0.17,
+    '4': 0.18, 'bb5': 0.19, '#4': 0.2,
+    'b5': 0.21, '5': 0.22, '#5': 0.23,
+    'b6': 0.24, '##5': 0.25, '6': 0.26,
+    'bb7': 0.27, '#6': 0.28, 'b7': 0.29,
+    '7': 0.3, 'b9': 0.31, '9': 0.32,
+    "#9": 0.33, '11': 0.34, '#11': 0.35,
+    'b13': 0.36, '13': 0.37
+}
+
+# The names of the steps between neighbouring intervals. This stays a
+# dictionary, so that a step outside the octave (or a repeated interval)
+# still raises a KeyError.
+_STEP_NAMES = {1: 'semitone', 2: 'tone', 3: 'hemiolion',
+               4: 'ditone', 5: 'diatessaron', 6: 'tritone',
+               7: 'diapente', 8: 'diapente + semitone',
+               9: 'diapente + tone', 10: 'diapente + hemiolion',
+               11: 'diapente + ditone', 12: 'diapason'}
+
 
 def sort_interval_names(interval_names: Iterable[str]) -> tuple[str, ...]:
     '''Take an unordered iterable of interval names and order them according
     to their numerical digit.
     '''
-    x = {
-        "1": 0.0, 'b2': 0.11, '2': 0.12,
-        'bb3': 0.13, '#2': 0.135, 'b3': 0.14,
-        '3': 0.15, 'b4': 0.16, '#3': 0.17,
-        '4': 0.18, 'bb5': 0.19, '#4': 0.2,
-        'b5': 0.21, '5': 0.22, '#5': 0.23,
-        'b6': 0.24, '##5': 0.25, '6': 0.26,
-        'bb7': 0.27, '#6': 0.28, 'b7': 0.29,
-        '7': 0.3, 'b9': 0.31, '9': 0.32,
-        "#9": 0.33, '11': 0.34, '#11': 0.35,
-        'b13': 0.36, '13': 0.37
-    }
-    # Not an elegant way to do it, but there aren't a huge number of
-    # intervals we need to support, even with the very exotic scales,
-    # and time is better spent elsewhere.
-    return tuple(sorted(interval_names, key=lambda n: x[n]))
+    return tuple(sorted(interval_names, key=_INTERVAL_ORDER.__getitem__))
 
 
 def calculate_interval(lower: str, higher: str) -> IntervalData:
@@ -67,27 +79,13 @@ def calculate_interval(lower: str, higher: str) -> IntervalData:
     '''
     low = decode_note_name(lower)
     high = decode_note_name(higher)
-    diatonic_names = get_heptatonic_note_names(low)
     diatonic_pattern = HEPTATONIC_SCALES[DIATONIC]
-    n = list(range(NOTES))
-    order = n[low[NOTE_NAME_INDEX]:] + n[:low[NOTE_NAME_INDEX]]
-    interval_base = order.index(high[NOTE_NAME_INDEX])
-    diatonic_accidentals = decode_note_name(
-        diatonic_names[interval_base])[ACCIDENTALS]
-    actual_accidentals = high[ACCIDENTALS]
-
-    accidentals = 0
-    if diatonic_accidentals == actual_accidentals:
-        accidentals = 0
-
-    elif diatonic_accidentals == 0:
-        accidentals = actual_accidentals
-
-    elif diatonic_accidentals < 0:
-        accidentals = -1 * diatonic_accidentals + actual_accidentals
-
-    elif diatonic_accidentals > 0:
-        accidentals = -1 * diatonic_accidentals + actual_accidentals
+    interval_base = (high[NOTE_NAME_INDEX] - low[NOTE_NAME_INDEX]) % NOTES
+    diatonic_accidentals = _get_diatonic_accidentals(
+        low[NOTE_NAME_INDEX], low[ACCIDENTALS])[interval_base]
+    # The interval is altered by however far the note is from its diatonic
+    # spelling in the lower note's key.
+    accidentals = high[ACCIDENTALS] - diatonic_accidentals
 
     sharps_flats = EMPTY_STRING
     if accidentals > 0:
@@ -104,6 +102,18 @@ def calculate_interval(lower: str, higher: str) -> IntervalData:
     return IntervalData(absolute=absolute_value, relative=interval_name)
 
 
+@lru_cache(maxsize=64)
+def _get_diatonic_accidentals(note_name_index: int, accidentals: int) -> tuple[int, ...]:
+    '''
+    Return the accidentals of each degree of the major scale on the note given
+    as its index and accidentals, decoded once for ``calculate_interval``.
+    '''
+    keynote = NoteNameData(note_name_index=note_name_index,
+                           accidentals=accidentals)
+    return tuple(decode_note_name(name)[ACCIDENTALS]
+                 for name in get_heptatonic_note_names(keynote))
+
+
 def calculate_formula(interval_structure: Iterable[int]) -> tuple[str, ...]:
     '''
     Calculate the semitone-tone step formula for the given interval structure.
@@ -118,19 +128,13 @@ def calculate_formula(interval_structure: Iterable[int]) -> tuple[str, ...]:
     tuple[str, ...]
         _description_
     '''
-    interval_structure = list(interval_structure) + [12]
-    elements = {1: 'semitone', 2: 'tone', 3: 'hemiolion',
-                4: 'ditone', 5: 'diatessaron', 6: 'tritone',
-                7: 'diapente', 8: 'diapente + semitone',
-                9: 'diapente + tone', 10: 'diapente + hemiolion',
-                11: 'diapente + ditone', 12: 'diapason'}
     formula: list[str] = []
     prev = 0
-    for num in sorted(interval_structure):
+    for num in sorted((*interval_structure, TONES)):
         diff = num - prev
         prev = num
         if num > 0:
-            formula.append(elements[diff])
+            formula.append(_STEP_NAMES[diff])
     return tuple(formula)
 
 
@@ -149,9 +153,8 @@ def get_double_octave(interval_structure: Iterable[int]) -> tuple[int, ...]:
         An array with the original intervals, plus the same intervals an 
         octave higher.
     '''
-    double_octave = list(interval_structure)
-    interval_structure = tuple(interval_structure)
-    for i in range(NOTES):
-        double_octave.append(interval_structure[i] + TONES)
-    return tuple(double_octave)
+    if not isinstance(interval_structure, tuple):
+        interval_structure = tuple(interval_structure)
+    return interval_structure + tuple(
+        x + TONES for x in interval_structure[:NOTES])
 
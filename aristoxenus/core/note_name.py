@@ -1,5 +1,6 @@
 
 import re
+from functools import lru_cache
 from aristoxenus.core.annotations import NoteNameData
 from aristoxenus.core.constants import (
     ACCIDENTALS,
@@ -18,6 +19,14 @@ from aristoxenus.core.errors import (
     ArgumentError
 )
 
+_NOTE_NAME_RE = re.compile(RE_PARSE_NOTE_NAME)
+_NATURAL_INDICES = {name: i for i, name in enumerate(NATURAL_NAMES)}
+_ACCIDENTAL_SYMBOLS = SHARP_SYMBOL + FLAT_SYMBOL
+# The index of each natural, keyed by its pitch class.
+_DIATONIC_INDICES = {
+    pitch: i for i, pitch in enumerate(HEPTATONIC_SCALES[DIATONIC])
+}
+
 
 def is_enharmonically_natural(note_data: NoteNameData) -> bool:
     '''
@@ -81,15 +90,34 @@ def decode_note_name(note_name: str) -> NoteNameData:
         If the note name does not conform to the expected format (e.g. begins
         with an unrecognizable root).
     '''
-    name = re.match(RE_PARSE_NOTE_NAME, note_name)
+    note_name_index, accidentals = _parse_note_name(note_name)
+    return NoteNameData(
+        note_name_index=note_name_index,
+        accidentals=accidentals
+    )
+
+
+@lru_cache(maxsize=256)
+def _parse_note_name(note_name: str) -> tuple[int, int]:
+    '''
+    Parse a note name into the index of its alphabetic name and its number
+    of accidentals. The result is a tuple, so that it can be cached safely.
+    '''
+    # Nearly every name is a natural followed only by accidentals, which can
+    # be read without the pattern.
+    note_name_index = _NATURAL_INDICES.get(note_name[:1])
+    accidentals = note_name[1:]
+    if note_name_index is not None and not accidentals.strip(_ACCIDENTAL_SYMBOLS):
+        return (note_name_index,
+                accidentals.count(SHARP_SYMBOL) - accidentals.count(FLAT_SYMBOL))
+    # Anything else is left to the pattern, which settles the edge cases
+    # (e.g. a trailing newline) as it always has.
+    name = _NOTE_NAME_RE.match(note_name)
     if name:
         name = name.groupdict()
         accidentals: int = name[ACCIDENTALS].count(
             SHARP_SYMBOL) - name[ACCIDENTALS].count(FLAT_SYMBOL)
-        return NoteNameData(
-            note_name_index=NATURAL_NAMES.index(name[NOTE_NAME]),
-            accidentals=accidentals
-        )
+        return NATURAL_NAMES.index(name[NOTE_NAME]), accidentals
     raise StringValidationError(note_name, NOTE_NAME)
 
 
@@ -110,21 +138,24 @@ def simplify_note_name(note_data: NoteNameData) -> NoteNameData:
     '''
     if note_data[ACCIDENTALS] == 0:
         return note_data
-    value = (HEPTATONIC_SCALES[DIATONIC]
-             [note_data[NOTE_NAME_INDEX]] + note_data[ACCIDENTALS]) % TONES
-    if value in HEPTATONIC_SCALES[DIATONIC]:
-        return NoteNameData(
-            note_name_index=HEPTATONIC_SCALES[DIATONIC].index(value),
-            accidentals=0)
-    if note_data[ACCIDENTALS] > 1:
-        value -= 1
-        return NoteNameData(
-            note_name_index=HEPTATONIC_SCALES[DIATONIC].index(value),
-            accidentals=1)
-    value += 1
-    return NoteNameData(
-        note_name_index=HEPTATONIC_SCALES[DIATONIC].index(value),
-        accidentals=-1)
+    note_name_index, accidentals = _simplify_note_name(
+        note_data[NOTE_NAME_INDEX], note_data[ACCIDENTALS])
+    return NoteNameData(note_name_index=note_name_index,
+                        accidentals=accidentals)
+
+
+@lru_cache(maxsize=256)
+def _simplify_note_name(note_name_index: int, accidentals: int) -> tuple[int, int]:
+    '''
+    Simplify a note name given as its index and accidentals. The result is a
+    tuple, so that it can be cached safely.
+    '''
+    value = (HEPTATONIC_SCALES[DIATONIC][note_name_index] + accidentals) % TONES
+    if value in _DIATONIC_INDICES:
+        return _DIATONIC_INDICES[value], 0
+    if accidentals > 1:
+        return _DIATONIC_INDICES[value - 1], 1
+    return _DIATONIC_INDICES[value + 1], -1
 
 
 def split_binomial_note(keynote: NoteNameData) -> tuple[NoteNameData, NoteNameData]:
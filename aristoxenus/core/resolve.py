@@ -1,5 +1,6 @@
 
 import re
+from functools import lru_cache
 from typing import Iterable, Optional
 
 from aristoxenus.core.heptatonic_spelling import get_heptatonic_interval_names
@@ -23,6 +24,7 @@ from aristoxenus.core.constants import (
     EMPTY_STRING,
     HEPTATONIC_SCALES,
     HEXATONIC_SCALES,
+    INTERVAL_NAME,
     IONIAN,
     MODAL_SERIES_KEYS,
     MODE_NAME,
@@ -51,7 +53,72 @@ from aristoxenus.core.note_name import decode_note_name
 from aristoxenus.core.rotate import rotate_interval_structure
 from aristoxenus.core.validation import validate_roman_name
 
+# The patterns are compiled once, with the flags that each call site uses.
+_CHORD_SYMBOL_RE = re.compile(RE_PARSE_CHORD_SYMBOL)
+_KEYNOTE_RE = re.compile(RE_KEYNOTE_EXPR)
+_COMPLETE_CANON_RE = re.compile(RE_COMPLETE_CANON_EXPR, re.I)
+_CANON_NAME_RES = tuple(re.compile(x, re.I) for x in RE_CANON_NAMES)
+_MODE_NAME_RES = tuple(re.compile(x, re.I) for x in RE_MODENAMES)
+# The number of rotations of the diatonic scale for each mode name.
+_MODE_ROTATIONS = {name: i for i, name in enumerate(MODAL_SERIES_KEYS)}
+# The interval modifiers of a modal name are found in a single scan, where
+# each kind of modifier names its interval group after itself. Additions and
+# subtractions are tried before alterations, since they contain them.
+_MODIFIER_KINDS = ('added', 'subtracted', 'natural', 'altered')
+_MODIFIER_RE = re.compile(
+    '|'.join(regex.replace(f"(?P<{INTERVAL_NAME}>", f"(?P<{kind}>")
+             for kind, regex in zip(_MODIFIER_KINDS, (
+                 RE_ADDED_INTERVAL, RE_SUBTRACTED_INTERVAL,
+                 RE_NATURAL_INTERVAL, RE_ALTERED_INTERVAL))),
+    re.I)
+# All the aliases are tried in a single match, where each alias is a named
+# alternative. The engine tries the alternatives in order, so the first alias
+# that matches still wins, and its group name identifies its scale form.
+_SCALE_ALIAS_RE = re.compile(
+    '|'.join(f"(?P<alias{i}>{regex})"
+             for i, (_, regex, _) in enumerate(SCALE_ALIASES)),
+    re.I)
+_SCALE_ALIAS_TARGETS = {
+    f"alias{i}": _id for i, (_, _, _id) in enumerate(SCALE_ALIASES)
+}
+
+
+def _get_interval_mask(interval_structure: Iterable[int]) -> int:
+    '''
+    Return a bitmask with one bit set for each interval in a structure, so
+    that two structures with the same intervals have equal masks. A negative
+    interval cannot belong to any mode, so its structure gets a mask of -1.
+    '''
+    mask = 0
+    for interval in interval_structure:
+        if interval < 0:
+            return -1
+        mask |= 1 << interval
+    return mask
+
+
+def _index_mode_masks() -> dict[int, tuple[str, int, str]]:
+    '''
+    Map the interval mask of every mode of every scale to its scale name, its
+    rotation and its mode name. Where modes share a mask, the first in search
+    order (heptatonic, then hexatonic, then pentatonic) is kept.
+    '''
+    index: dict[int, tuple[str, int, str]] = {}
+    for scale_group in (HEPTATONIC_SCALES, HEXATONIC_SCALES, PENTATONIC_SCALES):
+        for scale, base in scale_group.items():
+            for i in range(len(base)):
+                mode_name = (MODAL_SERIES_KEYS[i] if scale_group is HEPTATONIC_SCALES
+                             else str(i + 1))
+                mask = _get_interval_mask(rotate_interval_structure(base, i))
+                index.setdefault(mask, (scale, i, mode_name))
+    return index
+
+
+# The scale tables are read-only, so their modes can be indexed once.
+_MODE_MASK_INDEX = _index_mode_masks()
 
+
+@lru_cache(maxsize=512)
 def resolve_heptatonic_scale(scale_name: str, mode_name: Optional[str | int] = None) -> tuple[int, ...]:
     '''
     Attempt to resolve the given scale and mode name into a sequence of 
@@ -75,36 +142,39 @@ def resolve_heptatonic_scale(scale_name: str, mode_name: Optional[str | int] = N
     StringValidationError
         If the name of the scale or mode cannot be resolved.
     '''
-    if scale_name not in HEPTATONIC_SCALES:
+    scale = HEPTATONIC_SCALES.get(scale_name)
+    if scale is None:
         try:
             config = resolve_scale_alias(scale_name)
             return resolve_heptatonic_scale(*config)
         except StringValidationError:
             pass
 
-    # We expect that mode_name==None when scale_name is an alias,
-    # so None at this point presumably means 'ionian'.
-    if mode_name is None:
-        rotations = 0
-    elif isinstance(mode_name, int):
-        rotations = mode_name
-    elif mode_name.isdigit():
-        rotations = int(mode_name)
-    elif mode_name in MODAL_SERIES_KEYS:
-        rotations = MODAL_SERIES_KEYS.index(mode_name)
-    else:
-        raise StringValidationError(mode_name, MODE_NAME)
-
-    if scale_name in MODAL_SERIES_KEYS:
-        rotations = MODAL_SERIES_KEYS.index(scale_name)
+    rotations = _get_mode_rotations(mode_name)
+    if scale_name in _MODE_ROTATIONS:
+        rotations = _MODE_ROTATIONS[scale_name]
         scale = HEPTATONIC_SCALES[DIATONIC]
-        return rotate_interval_structure(scale, rotations % NOTES)
+    if scale is None:
+        raise StringValidationError(scale_name, SCALE_NAME)
+    return rotate_interval_structure(scale, rotations % NOTES)
 
-    if scale_name in HEPTATONIC_SCALES:
-        scale = HEPTATONIC_SCALES[scale_name]
-        return rotate_interval_structure(scale, rotations % NOTES)
 
-    raise StringValidationError(scale_name, SCALE_NAME)
+def _get_mode_rotations(mode_name: Optional[str | int]) -> int:
+    '''
+    Return the number of rotations implied by a mode name, an integer or a
+    string of digits for ``resolve_heptatonic_scale``.
+    '''
+    # We expect that mode_name==None when scale_name is an alias,
+    # so None at this point presumably means 'ionian'.
+    if mode_name is None:
+        return 0
+    if isinstance(mode_name, int):
+        return mode_name
+    if mode_name.isdigit():
+        return int(mode_name)
+    if mode_name in _MODE_ROTATIONS:
+        return _MODE_ROTATIONS[mode_name]
+    raise StringValidationError(mode_name, MODE_NAME)
 
 
 def resolve_chord_symbol(chord_symbol: str) -> ChordData:
@@ -126,7 +196,16 @@ def resolve_chord_symbol(chord_symbol: str) -> ChordData:
     StringValidationError
         If the chord symbol cannot be parsed.
     '''
-    chord = re.match(RE_PARSE_CHORD_SYMBOL, chord_symbol)
+    return _resolve_chord_symbol(chord_symbol).copy()
+
+
+@lru_cache(maxsize=512)
+def _resolve_chord_symbol(chord_symbol: str) -> ChordData:
+    '''
+    Resolve the chord data for ``resolve_chord_symbol``, which returns a copy
+    of the cached dictionary.
+    '''
+    chord = _CHORD_SYMBOL_RE.match(chord_symbol)
     if chord is None:
         for numeral in range(1, 8):
             if encode_roman_numeral(numeral).lower() in chord_symbol.lower() and SLASH_SYMBOL in chord_symbol:
@@ -180,43 +259,48 @@ def resolve_scale_pattern(interval_structure: Iterable[int] | int) -> ScalePatte
     --------
     TODO: Examples
     '''
+    if not isinstance(interval_structure, int):
+        interval_structure = tuple(interval_structure)
+    return _resolve_scale_pattern(interval_structure).copy()
+
+
+@lru_cache(maxsize=512)
+def _resolve_scale_pattern(interval_structure: tuple[int, ...] | int) -> ScalePatternData:
+    '''
+    Search for the scale pattern for ``resolve_scale_pattern``, which returns
+    a copy of the cached dictionary. The pattern is a tuple or an integer, so
+    that it can be hashed.
+    '''
     # When a scale pattern is an int, LSB is the unison, so all valid scales
     # must be odd numbers, e.g. 2741 = 101010110101 -> [0, 2, 4, 5, 7, 9, 11]
     if isinstance(interval_structure, int):
         if interval_structure % 2 == 0:
             raise ArgumentError(
                 f"Scale pattern integers must be odd numbers ({interval_structure=}).")
-        interval_structure = [
-            i for i in range(TONES)
-            if (n := 1 << i) & interval_structure == n
+        # Only the set bits are visited, lowest first. Bits above the octave
+        # are masked off, as they were never part of a pattern.
+        bits = interval_structure & ((1 << TONES) - 1)
+        indices: list[int] = []
+        while bits:
+            lowest = bits & -bits
+            indices.append(lowest.bit_length() - 1)
+            bits ^= lowest
+        interval_structure = tuple(indices)
+
+    # Every mode is indexed by its mask, so a single lookup finds the match.
+    mode = _MODE_MASK_INDEX.get(_get_interval_mask(interval_structure))
+    if mode is not None:
+        scale, i, mode_name = mode
+        aliases = [
+            name for name, _, (s, m) in SCALE_ALIASES
+            if s == scale and m == str(i + 1)
         ]
-
-    def __resolve_scale_pattern_in_group(
-        interval_structure: Iterable[int], 
-        scale_group: dict[str, tuple[int, ...]]
-        ) -> Optional[ScalePatternData]:
-        for scale, base in scale_group.items():
-            for i in range(len(base)):
-                pattern = rotate_interval_structure(base, i)
-                if set(pattern) == set(interval_structure):
-                    aliases = [
-                    name for name, _, (s, m) in SCALE_ALIASES
-                    if s == scale and m == str(i + 1)
-                    ]
-                    return ScalePatternData(
-                        interval_structure=tuple(interval_structure),
-                        scale_name=scale,
-                        mode_name=str(i + 1),
-                        aliases=tuple(aliases)
-                    )
-
-    if (s := __resolve_scale_pattern_in_group(interval_structure, HEPTATONIC_SCALES)):
-        s.update(mode_name=MODAL_SERIES_KEYS[int(s["mode_name"]) - 1])
-        return s
-    
-    for scale_group in (HEXATONIC_SCALES, PENTATONIC_SCALES):
-        if (s := __resolve_scale_pattern_in_group(interval_structure, scale_group)):
-            return s
+        return ScalePatternData(
+            interval_structure=interval_structure,
+            scale_name=scale,
+            mode_name=mode_name,
+            aliases=tuple(aliases)
+        )
 
     # TODO: sort out octatonics with regard to handling barry scales
     raise ArgumentError(f"Failed to find a match for {interval_structure=}. ")
@@ -224,6 +308,7 @@ def resolve_scale_pattern(interval_structure: Iterable[int] | int) -> ScalePatte
 
 
 
+@lru_cache(maxsize=512)
 def resolve_modal_name(mode_name: str) -> tuple[str, ...]:
     '''
     Take a string representing a modified modal name, and return the set of
@@ -252,8 +337,8 @@ def resolve_modal_name(mode_name: str) -> tuple[str, ...]:
         If there is more than one recognizeable mode name.
     '''
     base_symbol: list[str] = []
-    for i, regex in enumerate(RE_MODENAMES):
-        if re.findall(regex, mode_name, flags=re.I):
+    for i, regex in enumerate(_MODE_NAME_RES):
+        if regex.search(mode_name):
             base_symbol.append(MODAL_SERIES_KEYS[i])
 
     if len(base_symbol) > 1:
@@ -264,23 +349,30 @@ def resolve_modal_name(mode_name: str) -> tuple[str, ...]:
     i = MODAL_SERIES_KEYS.index(base_symbol.pop())
     d = HEPTATONIC_SCALES[DIATONIC]
     mode_pattern = rotate_interval_structure(d, i)
-    naturals = re.findall(RE_NATURAL_INTERVAL, mode_name, flags=re.I)
-    altereds = re.findall(RE_ALTERED_INTERVAL, mode_name, flags=re.I)
-    additions = re.findall(RE_ADDED_INTERVAL, mode_name, flags=re.I)
-    subtractions = re.findall(RE_SUBTRACTED_INTERVAL, mode_name, flags=re.I)
-    substitutions = naturals + altereds
+    modifiers: dict[str, list[str]] = {kind: [] for kind in _MODIFIER_KINDS}
+    for match in _MODIFIER_RE.finditer(mode_name):
+        kind = match.lastgroup
+        assert kind is not None
+        interval = match.group(kind)
+        modifiers[kind].append(interval)
+        # An added or subtracted interval with accidentals also counts as an
+        # alteration (e.g. the 'b6' in 'add b6').
+        if kind != 'altered' and not interval[0].isdigit():
+            modifiers['altered'].append(interval)
+    additions = modifiers['added']
+    subtractions = modifiers['subtracted']
+    substitutions = modifiers['natural'] + modifiers['altered']
     normal_intervals = get_heptatonic_interval_names(mode_pattern)
+    # Group the substitutions by degree, so that each interval of the mode is
+    # replaced by every substitution for its degree, in the order given.
+    substitutions_by_degree: dict[str, list[str]] = {}
+    for substitution in substitutions:
+        substitutions_by_degree.setdefault(
+            _get_degree_digits(substitution), []).append(substitution)
     collation: list[str] = []
     for interval in normal_intervals:
-        found = False
-        for substitution in substitutions:
-            d1 = list(x for x in interval if x.isdigit())
-            d2 = list(x for x in substitution if x.isdigit())
-            if d1 == d2:
-                found = True
-                collation.append(substitution)
-        if not found:
-            collation.append(interval)
+        collation.extend(substitutions_by_degree.get(
+            _get_degree_digits(interval), (interval,)))
 
     for addition in additions:
         collation.append(addition)
@@ -290,6 +382,15 @@ def resolve_modal_name(mode_name: str) -> tuple[str, ...]:
     return sort_interval_names(collation)
 
 
+def _get_degree_digits(interval_name: str) -> str:
+    '''
+    Return only the digits of an interval name, by which the intervals of
+    the same degree are matched in ``resolve_modal_name``.
+    '''
+    return EMPTY_STRING.join(filter(str.isdigit, interval_name))
+
+
+@lru_cache(maxsize=512)
 def resolve_scale_alias(scale_name: str) -> tuple[str, str]:
     '''
     Attempt to turn a scale alias symbol into a canonical scaleform pair.
@@ -314,9 +415,8 @@ def resolve_scale_alias(scale_name: str) -> tuple[str, str]:
         If the scale alias cannot be parsed within the confines of the system.
     '''
     # TODO tests
-    for _, regex, _id in SCALE_ALIASES:
-        if re.match(regex, scale_name, flags=re.I):
-            return _id
+    if (match := _SCALE_ALIAS_RE.match(scale_name)) and match.lastgroup:
+        return _SCALE_ALIAS_TARGETS[match.lastgroup]
     try:
         intervals = resolve_modal_name(scale_name)
         structure = convert_interval_names_to_integers(intervals)
@@ -327,6 +427,7 @@ def resolve_scale_alias(scale_name: str) -> tuple[str, str]:
     
 
 
+@lru_cache(maxsize=512)
 def resolve_generic_scale_request(scale_name: str) -> tuple[str, str, str]:
     '''
     Resolve a generic key-and-scale symbol and return a tuple containing 
@@ -360,21 +461,21 @@ def resolve_generic_scale_request(scale_name: str) -> tuple[str, str, str]:
         The tonic note name, plus the names in our canon for the scale and mode
         represented by the scale symbol.
     '''
-    if (match := re.match(RE_COMPLETE_CANON_EXPR, scale_name, flags=re.I)) is not None:
+    if (match := _COMPLETE_CANON_RE.match(scale_name)) is not None:
         note = match.group(NOTE_NAME) or NATURAL_NAMES[0]
         scale_abbr = match.group(SCALE_NAME)
         mode_abbr = match.group(MODE_NAME)
         scale, mode = "", ""
-        for i, name in enumerate(RE_CANON_NAMES):
-            if re.match(name, scale_abbr, flags=re.I):
+        for i, name in enumerate(_CANON_NAME_RES):
+            if name.match(scale_abbr):
                 scale = list(HEPTATONIC_SCALES.keys())[i]
-        for i, mode_name in enumerate(RE_MODENAMES):
-            if re.match(mode_name, mode_abbr, flags=re.I):
+        for i, mode_name in enumerate(_MODE_NAME_RES):
+            if mode_name.match(mode_abbr):
                 mode = MODAL_SERIES_KEYS[i]
                 
         return note, scale, mode
     
-    keynote = re.match(RE_KEYNOTE_EXPR, scale_name)
+    keynote = _KEYNOTE_RE.match(scale_name)
     if not keynote:
         kn = NATURAL_NAMES[0]
     else:
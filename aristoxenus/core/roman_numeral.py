@@ -15,23 +15,23 @@ __numerals: dict[str, int] = {
     'I': 1
 }
 
-__partials: dict[str, int] = {
-    'IV': 4,
-    'IX': 9,
-    'XL': 40,
-    'XC': 90,
-    'CD': 400,
-    'CM': 900
-}
-
-__errors: dict[str, str] = {
-    'IIII': 'IV',
-    'VIV': 'IX',
-    'XXXX': 'XL',
-    'LXL': 'XC',
-    'CCCC': 'CD',
-    'DCD': 'CM'
-}
+# Every symbol of a numeral, including the subtractive pairs, from the
+# largest value down, so that each can be taken as often as it fits.
+__symbols: tuple[tuple[str, int], ...] = (
+    ('M', 1000),
+    ('CM', 900),
+    ('D', 500),
+    ('CD', 400),
+    ('C', 100),
+    ('XC', 90),
+    ('L', 50),
+    ('XL', 40),
+    ('X', 10),
+    ('IX', 9),
+    ('V', 5),
+    ('IV', 4),
+    ('I', 1)
+)
 
 def encode_roman_numeral(indian_numeral: int) -> str:
     '''
@@ -65,17 +65,11 @@ def encode_roman_numeral(indian_numeral: int) -> str:
     '''
     if indian_numeral not in range(1, 4000):
         raise ValueError(f"Can only convert numbers 1-399 ({indian_numeral=})")
-    roman_numeral_: str = ''
-    for numeral, value in __numerals.items():
-        while indian_numeral >= value:
-            roman_numeral_ += numeral
-            indian_numeral -= value
-        for error, correction in __errors.items():
-            if error in roman_numeral_:
-                assert isinstance(correction, str)
-                roman_numeral_ = roman_numeral_.replace(error, correction)
-
-    return roman_numeral_
+    parts: list[str] = []
+    for numeral, value in __symbols:
+        count, indian_numeral = divmod(indian_numeral, value)
+        parts.append(numeral * count)
+    return ''.join(parts)
 
 
 def decode_roman_numeral(symbol: str) -> int:
@@ -103,14 +97,13 @@ def decode_roman_numeral(symbol: str) -> int:
     >>> decode_roman_numeral('CCLXIII')
     263
     '''
-    values: list[int] = []
-    for partial, value in __partials.items():
-        if partial in symbol:
-            assert isinstance(value, int)
-            values.append(value)
-            symbol = symbol.replace(partial, "")
-    for numeral, value in __numerals.items():
-        if numeral in symbol:
-            values.append(value*symbol.count(numeral))
-    return sum(values)
+    # Read from the right, a numeral smaller than the one after it is
+    # subtracted (e.g. the 'I' in 'IX'). Other characters count for nothing.
+    total = 0
+    previous = 0
+    for numeral in reversed(symbol):
+        value = __numerals.get(numeral, 0)
+        total += -value if value < previous else value
+        previous = value
+    return total
 
@@ -1,5 +1,6 @@
 
 
+from functools import lru_cache
 from typing import Sequence
 
 from aristoxenus.core.annotations import ChordData
@@ -30,17 +31,24 @@ def rotate_interval_structure(interval_structure: Sequence[int], mode_idx: int)
         A tuple of integers representing the original scale pattern from 
         the new modal perspective.
     '''
+    return _rotate_interval_structure(tuple(interval_structure), mode_idx)
+
+
+@lru_cache(maxsize=1024)
+def _rotate_interval_structure(interval_structure: tuple[int, ...], mode_idx: int) -> tuple[int, ...]:
+    '''
+    Rotate an interval structure given as a tuple, so that the result can be
+    cached.
+    '''
     modal_semitones_offset = interval_structure[mode_idx]
-    pitches: list[int] = []
-    for i in range(len(interval_structure)):
-        new_note_idx = (i + mode_idx) % len(interval_structure)
-        original_value = interval_structure[new_note_idx]
-        tones_offset = ((i + mode_idx) // len(interval_structure)) * TONES
-        new_value = original_value - modal_semitones_offset + tones_offset
-        if new_value < 0:
-            new_value *= -1
-        pitches.append(new_value)
-    return tuple(pitches)
+    # The notes from the new starting index onward keep their octave, and
+    # those before it move up one. A negative index counts back from the
+    # end, which puts the whole result one octave lower.
+    offset = -modal_semitones_offset - (TONES if mode_idx < 0 else 0)
+    split = mode_idx % len(interval_structure)
+    # Any interval that still falls below the new unison is flipped upward.
+    return (tuple(abs(x + offset) for x in interval_structure[split:])
+            + tuple(abs(x + offset + TONES) for x in interval_structure[:split]))
 
 
 def rotate_chord(chord: ChordData, new_bass_idx: int) -> ChordData:
@@ -63,16 +71,15 @@ def rotate_chord(chord: ChordData, new_bass_idx: int) -> ChordData:
         The input chord information, but rotated so that the elements at
         the given index are now first.
     '''
-    if not new_bass_idx in range(len(chord[INTERVAL_STRUCTURE])):
-        new_bass_idx %= len(chord[INTERVAL_STRUCTURE])
-    names = list(chord[NOTE_NAMES][new_bass_idx:]) + \
-        list(chord[NOTE_NAMES][:new_bass_idx])
-    symbols = list(chord[INTERVAL_NAMES][new_bass_idx:]) + \
-        list(chord[INTERVAL_NAMES][:new_bass_idx])
+    new_bass_idx %= len(chord[INTERVAL_STRUCTURE])
+    # The names are normally tuples already, so slicing and joining them
+    # builds the result directly; tuple() only copies any other sequence.
+    names = chord[NOTE_NAMES]
+    symbols = chord[INTERVAL_NAMES]
     intervals = rotate_interval_structure(
         chord[INTERVAL_STRUCTURE], new_bass_idx)
     return ChordData(
         chord_symbol=chord[CHORD_SYMBOL],
-        note_names=tuple(names),
-        interval_names=tuple(symbols),
+        note_names=tuple(names[new_bass_idx:] + names[:new_bass_idx]),
+        interval_names=tuple(symbols[new_bass_idx:] + symbols[:new_bass_idx]),
         interval_structure=intervals)
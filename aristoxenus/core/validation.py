@@ -9,14 +9,17 @@ from aristoxenus.core.constants import (
     NOTE_NAME_INDEX,
     NOTES,
     RE_PARSE_INTERVAL_NAME,
-    RE_PARSE_NOTE_NAME,
     RE_PARSE_ROMAN_NAME
 )
 from aristoxenus.core.note_name import (
+    _NOTE_NAME_RE,
     simplify_note_name,
     decode_note_name
 )
 
+_ROMAN_NAME_RE = re.compile(RE_PARSE_ROMAN_NAME)
+_INTERVAL_NAME_RE = re.compile(RE_PARSE_INTERVAL_NAME)
+
 
 def validate_heptatonic_spelling(note_names: Iterable[str]) -> bool:
     '''
@@ -74,7 +77,7 @@ def validate_alphabetic_name(string: str) -> bool:
     bool
         True, if the string is a valid alphabetic note name.
     '''
-    return re.match(RE_PARSE_NOTE_NAME, string) is not None
+    return _NOTE_NAME_RE.match(string) is not None
 
 
 def validate_roman_name(string: str) -> bool:
@@ -95,7 +98,7 @@ def validate_roman_name(string: str) -> bool:
     bool
         True, if the name is a valid Roman interval name.
     '''
-    return re.match(RE_PARSE_ROMAN_NAME, string) is not None
+    return _ROMAN_NAME_RE.match(string) is not None
 
 
 def validate_interval_name(string: str) -> bool:
@@ -116,4 +119,4 @@ def validate_interval_name(string: str) -> bool:
     bool
         True, if the name is a valid Indian interval name.
     '''
-    return re.match(RE_PARSE_INTERVAL_NAME, string) is not None
+    return _INTERVAL_NAME_RE.match(string) is not None
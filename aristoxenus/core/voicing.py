@@ -33,31 +33,36 @@ def apply_drop_voicing(chord_data: ChordData, drop_notes: Iterable[int]) -> Chor
         If one of the drop notes is already the bass (= 0). We do this to 
         ensure that the output is in the same inversion as the input.
     '''
-    interval_structure = list(chord_data[INTERVAL_STRUCTURE])
-    note_names = list(chord_data[NOTE_NAMES])
-    interval_symbols = list(chord_data[INTERVAL_NAMES])
+    size = len(chord_data[NOTE_NAMES])
+    # Negative indices count back from the top of the chord, and each note
+    # is only raised once, however often its index is given. Indices outside
+    # the chord in either direction are ignored.
+    drops: list[int] = []
+    dropped: set[int] = set()
     for i in drop_notes:
+        if not -size <= i < size:
+            continue
+        if i < 0:
+            i += size
         if i == 0:
             raise ArgumentError(
                 f"Interval 0 cannot be modified ({drop_notes=}).")
-        if i >= len(note_names):
-            continue
-
-        interval = chord_data[INTERVAL_STRUCTURE][i]
-        interval_structure.remove(interval)
-        interval_structure.append(interval + TONES)
-
-        name = chord_data[NOTE_NAMES][i]
-        note_names.remove(name)
-        note_names.append(name)
-
-        symbol = chord_data[INTERVAL_NAMES][i]
-        interval_symbols.remove(symbol)
-        interval_symbols.append(symbol)
+        if i not in dropped:
+            dropped.add(i)
+            drops.append(i)
 
+    # The raised notes are moved to the top of the chord in the order given,
+    # so we only need to work out the new order of indices once.
+    order = [i for i in range(size) if i not in dropped] + drops
+    interval_structure = chord_data[INTERVAL_STRUCTURE]
+    note_names = chord_data[NOTE_NAMES]
+    interval_symbols = chord_data[INTERVAL_NAMES]
     return ChordData(
         chord_symbol=chord_data[CHORD_SYMBOL],
-        note_names=tuple(note_names),
-        interval_names=tuple(interval_symbols),
-        interval_structure=tuple(interval_structure)
+        note_names=tuple(note_names[i] for i in order),
+        interval_names=tuple(interval_symbols[i] for i in order),
+        interval_structure=tuple(
+            interval_structure[i] + TONES if i in dropped
+            else interval_structure[i]
+            for i in order)
     )
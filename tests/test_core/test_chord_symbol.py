@@ -54,13 +54,25 @@ params = pytest.mark.parametrize
         (["1", "3", "##5", "7"], 'maj7##5'),
         (["1", "3", "bb5", "7"], 'maj7bb5'),
         (["1", "3", "##5", "bb7"], 'maj##5bb7'),
-        (['1', '4', '5', 'b7'], '7sus4')
+        (['1', '4', '5', 'b7'], '7sus4'),
+        (['1', 'b3', '5', 'b7', 'b13', 'b9', 'b11'], 'min7b9b11b13'),
+        (['1', '4', '5', '13', '6', '11'], '6sus4add11add13')
     ]
 )
 def test_encode_chord_symbol(interval_names: Iterable[str], expected: str) -> None:
     assert c_s.encode_chord_symbol(interval_names) == expected
 
 
+@params(
+    'interval_names, expected', [
+        (['1', '3', '5', 'x'], 'majaddx'),
+        (['1', '3', '5', 'b13', '9x', '#9'], 'maj#9b13add9x')
+    ]
+)
+def test_encode_chord_symbol_unnumbered_names_last(interval_names: Iterable[str], expected: str) -> None:
+    assert c_s.encode_chord_symbol(interval_names) == expected
+
+
 @params(
     'chord_symbol, expected', [
         ('C', ('1', '3', '5')),
@@ -109,3 +121,34 @@ def test_encode_chord_symbol(interval_names: Iterable[str], expected: str) -> No
 def test_decode_chord_symbol(chord_symbol: str, expected: tuple[str, ...]) -> None:
     assert c_s.decode_chord_symbol(chord_symbol) == expected
 
+
+@params(
+    'chord_symbol, expected', [
+        ('Cmaj7#5##5', ('1', '3', '#5', '7')),
+        ('C7b5bb5', ('1', '3', 'b5', 'b7')),
+        ('C13b5bb5#9add11', ('1', '3', 'b5', 'b7', '9', '#9', '11', '13')),
+        ('C7no3no3', ('1', '5', 'b7'))
+    ]
+)
+def test_decode_chord_symbol_repeated_modifications(chord_symbol: str, expected: tuple[str, ...]) -> None:
+    assert c_s.decode_chord_symbol(chord_symbol) == expected
+
+
+@params(
+    'interval_names', [
+        ('1', '3', 'b5', 'bb5'),
+        ('1', '3', '#5', '##5', '7'),
+        ('1', '3', 'b5', 'bb5', 'b7')
+    ]
+)
+def test_encoded_chord_symbol_decodes(interval_names: tuple[str, ...]) -> None:
+    chord_symbol = 'C' + c_s.encode_chord_symbol(interval_names)
+    assert set(c_s.decode_chord_symbol(chord_symbol)) <= set(interval_names)
+
+
+
+def test_get_chord_style_returns_new_data() -> None:
+    style = c_s.get_chord_style('Em7/G')
+    assert style == {'slash': True, 'min_symbol': 'm'}
+    style['min_symbol'] = '-'
+    assert c_s.get_chord_style('Em7/G') == {'slash': True, 'min_symbol': 'm'}
@@ -4,6 +4,7 @@ import pytest
 from aristoxenus.core import convert_names
 from aristoxenus.core.annotations import NoteNameData
 from aristoxenus.core.constants import ACCIDENTALS, NOTE_NAME_INDEX
+from aristoxenus.core.errors import StringValidationError
 
 
 params = pytest.mark.parametrize
@@ -59,6 +60,7 @@ def test_convert_roman_names_to_interval_names(roman_names: Iterable[str] | str,
         (cast(NoteNameData, {NOTE_NAME_INDEX: 3, ACCIDENTALS: 1}), ('1', '2', 'b7', '11'), ('F#', 'G#', 'E', 'B')),
         (cast(NoteNameData, {NOTE_NAME_INDEX: 4, ACCIDENTALS: -1}), ('1', 'b3', 'b5', 'bb7', '9'), ('Gb', 'Bbb', 'Dbb', 'Fbb', 'Ab')),
         (cast(NoteNameData, {NOTE_NAME_INDEX: 5, ACCIDENTALS: 1}), ('4', '1', '2', '5'), ('D#', 'A#', 'B#', 'E#')),
+        (cast(NoteNameData, {NOTE_NAME_INDEX: 6, ACCIDENTALS: -1}), ('#b3', 'b#b5', '##7'), ('D', 'Fb', 'A##')),
     ]
 )
 def test_convert_interval_names_to_note_names(root: NoteNameData, interval_names: Iterable[str], expected: tuple[str, ...]) -> None:
@@ -85,6 +87,12 @@ def test_convert_interval_names_to_integers(interval_names: Sequence[str], expec
     assert convert_names.convert_interval_names_to_integers(interval_names) == expected
 
 
+@params('interval_names', [('1', 'x3'), ('1', '3b'), ('1', 'b')])
+def test_convert_interval_names_to_integers_rejects_bad_names(interval_names: Sequence[str]) -> None:
+    with pytest.raises(StringValidationError):
+        convert_names.convert_interval_names_to_integers(interval_names)
+
+
 @params(
     'note_names, expected', [
         (('A', 'C#', 'E', 'A', 'C#', 'E', 'A'), (0, 4, 7, 12, 16, 19, 24)),
@@ -96,7 +104,9 @@ def test_convert_interval_names_to_integers(interval_names: Sequence[str], expec
         (('B', 'B', 'B', 'B'), (0, 12, 24, 36)),
         (('G', 'Bb', 'D', 'F#'), (0, 3, 7, 11)),
         (('C', 'D#', 'F#', 'G#', 'A', 'B'), (0, 3, 6, 8, 9, 11)),
-        (('D', 'F', 'Ab', 'Cb', 'E', 'G', 'Bb'), (0, 3, 6, 9, 14, 17, 20))
+        (('D', 'F', 'Ab', 'Cb', 'E', 'G', 'Bb'), (0, 3, 6, 9, 14, 17, 20)),
+        (('C', 'E', 'B#####', 'Dbbbbb'), (0, 4, 16, 21)),
+        (('F#####', 'A', 'C'), (0, 11, 14))
     ]
 )
 def test_convert_note_names_to_integers(note_names: Sequence[str], expected: tuple[int, ...]) -> None:
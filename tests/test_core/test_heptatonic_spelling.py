@@ -3,6 +3,9 @@ import pytest
 
 from aristoxenus.core.annotations import NoteNameData
 from aristoxenus.core import heptatonic_spelling
+from aristoxenus.core.constants import HEPTATONIC_SCALES
+from aristoxenus.core.errors import ArgumentError
+from aristoxenus.core.note_name import encode_note_name
 
 params = pytest.mark.parametrize
 
@@ -80,3 +83,18 @@ def test_get_best_heptatonic_spelling(keynote: NoteNameData, interval_structure:
 def test_get_heptatonic_interval_symbols(interval_structure: Iterable[int], expected: tuple[str, ...]) -> None:
     assert heptatonic_spelling.get_heptatonic_interval_names(interval_structure) == expected
 
+
+
+def test_get_heptatonic_interval_symbols_rejects_non_heptatonic() -> None:
+    for _ in range(2):
+        with pytest.raises(ArgumentError):
+            heptatonic_spelling.get_heptatonic_interval_names([0, 2, 4, 7, 9])
+
+
+@params('note_name_index', range(7))
+@params('accidentals', range(-2, 3))
+def test_get_heptatonic_scale_notes_start_on_keynote(note_name_index: int, accidentals: int) -> None:
+    keynote = NoteNameData(note_name_index=note_name_index, accidentals=accidentals)
+    for interval_structure in HEPTATONIC_SCALES.values():
+        note_names = heptatonic_spelling.get_heptatonic_note_names(keynote, interval_structure)
+        assert note_names[0] == encode_note_name(keynote)
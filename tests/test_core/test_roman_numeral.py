@@ -0,0 +1,53 @@
+import pytest
+
+from aristoxenus.core import roman_numeral
+
+params = pytest.mark.parametrize
+
+
+@params(
+    'indian_numeral, expected', [
+        (1, 'I'),
+        (4, 'IV'),
+        (9, 'IX'),
+        (14, 'XIV'),
+        (40, 'XL'),
+        (90, 'XC'),
+        (263, 'CCLXIII'),
+        (959, 'CMLIX'),
+        (1318, 'MCCCXVIII'),
+        (1449, 'MCDXLIX'),
+        (3999, 'MMMCMXCIX')
+    ]
+)
+def test_encode_roman_numeral(indian_numeral: int, expected: str) -> None:
+    assert roman_numeral.encode_roman_numeral(indian_numeral) == expected
+
+
+@params('indian_numeral', [0, 4000, -1])
+def test_encode_roman_numeral_rejects_out_of_range(indian_numeral: int) -> None:
+    with pytest.raises(ValueError):
+        roman_numeral.encode_roman_numeral(indian_numeral)
+
+
+@params(
+    'symbol, expected', [
+        ('I', 1),
+        ('IV', 4),
+        ('VII', 7),
+        ('XLIX', 49),
+        ('CCLXIII', 263),
+        ('CMLIX', 959),
+        ('MCCCXVIII', 1318),
+        ('MCDXLIX', 1449),
+        ('MMMCMXCIX', 3999)
+    ]
+)
+def test_decode_roman_numeral(symbol: str, expected: int) -> None:
+    assert roman_numeral.decode_roman_numeral(symbol) == expected
+
+
+def test_decode_roman_numeral_round_trip() -> None:
+    for n in range(1, 4000):
+        assert roman_numeral.decode_roman_numeral(
+            roman_numeral.encode_roman_numeral(n)) == n
@@ -2,6 +2,7 @@ from typing import Iterable, cast
 import pytest
 
 from aristoxenus.core.annotations import ChordData
+from aristoxenus.core.errors import ArgumentError
 from aristoxenus.core import (
     voicing
 )
@@ -28,3 +29,21 @@ def Cmajor7() -> ChordData:
 def test_apply_drop_voicing(Cmajor7: ChordData, drop_notes: Iterable[int], expected: ChordData) -> None:
     assert voicing.apply_drop_voicing(Cmajor7, drop_notes) == expected
 
+
+
+@params('drop_notes', [(-1,), (-2, 1), (1, 1), (2, 2), (3, -1, 3)])
+def test_apply_drop_voicing_keeps_every_note_once(Cmajor7: ChordData, drop_notes: Iterable[int]) -> None:
+    result = voicing.apply_drop_voicing(Cmajor7, drop_notes)
+    assert len(result[NOTE_NAMES]) == len(Cmajor7[NOTE_NAMES])
+    assert sorted(result[NOTE_NAMES]) == sorted(Cmajor7[NOTE_NAMES])
+    assert len(result[INTERVAL_STRUCTURE]) == len(Cmajor7[INTERVAL_STRUCTURE])
+
+
+def test_apply_drop_voicing_rejects_negative_bass(Cmajor7: ChordData) -> None:
+    with pytest.raises(ArgumentError):
+        voicing.apply_drop_voicing(Cmajor7, (-4,))
+
+
+@params('drop_notes', [(4,), (-5,), (-8, 9)])
+def test_apply_drop_voicing_ignores_indices_outside_chord(Cmajor7: ChordData, drop_notes: Iterable[int]) -> None:
+    assert voicing.apply_drop_voicing(Cmajor7, drop_notes) == Cmajor7
@@ -0,0 +1,63 @@
+# pylint: disable=missing-function-docstring,line-too-long,missing-module-docstring,invalid-name,redefined-outer-name
+import pytest
+
+from aristoxenus import api
+
+params = pytest.mark.parametrize
+
+
+@params(
+    'attribute, value, expected', [
+        ('keynote', 'D', ('D', 'E', 'F#', 'G', 'A', 'B', 'C#')),
+        ('scale_name', 'harmonic', ('C', 'D', 'E', 'F', 'G', 'Ab', 'B')),
+        ('mode_name', 'dorian', ('C', 'D', 'Eb', 'F', 'G', 'A', 'Bb')),
+    ]
+)
+def test_heptatonic_scale_reconfiguration(attribute: str, value: str, expected: tuple[str, ...]) -> None:
+    scale = api.HeptatonicScale()
+    assert scale.note_names == ('C', 'D', 'E', 'F', 'G', 'A', 'B')
+    setattr(scale, attribute, value)
+    assert scale.note_names == expected
+
+
+def test_chord_symbol_follows_style() -> None:
+    chord = api.Chord.from_symbol('Emin7/G')
+    assert chord.symbol == 'Emin7/G'
+    assert chord.set_min_symbol('m').symbol == 'Em7/G'
+    assert chord.use_slash(False).symbol == 'Emin7'
+    assert chord.symbol == 'Emin7/G'
+    assert chord.get_style()['min_symbol'] == 'min'
+
+
+def test_chord_reset() -> None:
+    chord = api.Chord.from_symbol('Cmaj7').invert(2).apply_voicing('d2').reset()
+    assert chord.note_names == ('C', 'E', 'G', 'B')
+    assert chord.interval_names == ('1', '3', '5', '7')
+
+
+@params(
+    'pattern, expected', [
+        ((1, 3, 5), (('C', '1', 1), ('E', '3', 1), ('G', '5', 1))),
+        ((7, 8, 14, 15), (('B', '7', 1), ('C', '1', 2), ('B', '7', 2), ('C', '1', 3))),
+    ]
+)
+def test_heptatonic_scale_native_pattern(pattern: tuple[int, ...], expected: tuple[tuple[str, str, int], ...]) -> None:
+    notes = api.HeptatonicScale().get_native_pattern(pattern)
+    assert tuple((n.note_name, n.interval_name, n.octave) for n in notes) == expected
+    assert notes[-1] == api.HeptatonicScale().get_degree(pattern[-1])
+
+
+def test_chord_representation() -> None:
+    chord = api.Chord.from_symbol('Cmaj7')
+    assert str(chord) == 'Cmaj7'
+    assert repr(chord) == "Chord(chord_symbol='Cmaj7')"
+    assert chord.verbose_repr() == "Chord(chord_symbol='Cmaj7', note_names=('C', 'E', 'G', 'B'), interval_symbols=('1', '3', '5', '7'), interval_structure=(0, 4, 7, 11))"
+
+
+def test_heptatonic_scale_chords_follow_reconfiguration() -> None:
+    scale = api.HeptatonicScale()
+    assert scale.get_tertial_tetrad(2).symbol == 'Dmin7'
+    assert scale.get_sus4_triad(1).symbol == 'Csus4'
+    scale.keynote = 'D'
+    assert scale.get_tertial_tetrad(2).symbol == 'Emin7'
+    assert scale.get_sus4_triad(1).symbol == 'Dsus4'
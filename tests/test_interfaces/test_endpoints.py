@@ -26,3 +26,58 @@ params = pytest.mark.parametrize
 )
 def test_get_chord_symbol(intervals: Iterable[str | int], config: Optional[ChordStyle], expected: dict[str, str]) -> None:
     assert api.get_chord_symbol(intervals, config) == expected
+
+
+def test_get_heptatonic_scale() -> None:
+    scale = api.get_heptatonic_scale('Db', 'harmonic', 'dorian')
+    assert scale['requested_rendering'] == ('Db', 'Eb', 'Fb', 'Gb', 'Abb', 'Bb', 'Cb')
+    assert scale['recommended_rendering'] == ('C#', 'D#', 'E', 'F#', 'G', 'A#', 'B')
+    scale['keynote'] = 'E'
+    assert api.get_heptatonic_scale('Db', 'harmonic', 'dorian')['keynote'] == 'Db'
+
+
+def test_get_heptatonic_scale_without_recommendation() -> None:
+    scale = api.get_heptatonic_scale('Db', 'harmonic', 'dorian', recommend=False)
+    assert scale['recommended_keynote'] == 'Db'
+    assert scale['recommended_rendering'] == scale['requested_rendering']
+
+
+def test_get_heptatonic_chords() -> None:
+    options = {'degrees': (1, 2, 9), 'sizes': (3, 4), 'inversions': (0, 1), 'voicings': ('close', 'd3')}
+    chords = api.get_heptatonic_chords('D', 'harmonic', 'dorian', **options, chord_style={'slash': True})
+    expected = tuple(
+        api.get_heptatonic_chord('D', 'harmonic', 'dorian', degree, size, inversion, voicing, chord_style={'slash': True})
+        for size in options['sizes'] for degree in options['degrees']
+        for inversion in options['inversions'] for voicing in options['voicings']
+    )
+    assert len(chords) == 24
+    assert chords == expected
+
+
+@params(
+    'intervals, expected', [
+        ((0, 4, 7, 11), ('1', '3', '5', '7')),
+        ((12, 16, 19, 22), ('1', '3', '5', 'b7')),
+        ((0, '3', 7, 'b7'), ('1', '3', '5', 'b7')),
+    ]
+)
+def test_get_chord_symbol_from_integers(intervals: tuple[int | str, ...], expected: tuple[str, ...]) -> None:
+    assert api.get_chord_symbol(intervals) == api.get_chord_symbol(expected)
+
+
+@params(
+    'chord_style, expected', [
+        (None, 'Emin7'),
+        ({'slash': False}, 'Emin7'),
+        ({'slash': True}, 'Emin7/G'),
+    ]
+)
+def test_get_heptatonic_chord_slash(chord_style: Optional[ChordStyle], expected: str) -> None:
+    chord = api.get_heptatonic_chord('E', mode_name='dorian', chord_size=4, chord_inversion=1, chord_style=chord_style)
+    assert chord[CHORD_SYMBOL] == expected
+
+
+def test_get_chord_from_symbol_returns_new_data() -> None:
+    chord = api.get_chord_from_symbol('Emin7/G')
+    chord[CHORD_SYMBOL] = 'G6'
+    assert api.get_chord_from_symbol('Emin7/G')[CHORD_SYMBOL] == 'Emin7/G'